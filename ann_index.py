@@ -0,0 +1,93 @@
+"""
+ANN Index - Inverted-file (IVF) approximate nearest-neighbour search
+Clusters the gallery around coarse k-means centroids and, per query, only
+scores the rows of the `nprobe` closest clusters. Raising `nprobe` trades
+latency for recall; nprobe == n_lists is exact search.
+"""
+
+import numpy as np
+
+from face_matcher import ENCODING_DIM, pairwise_sq_distances
+
+
+class IVFIndex:
+    """Coarse-quantized inverted-file index over a float32 encoding matrix"""
+
+    def __init__(self, encodings, n_lists=None, nprobe=4, iterations=20, seed=0):
+        self.encodings = np.ascontiguousarray(np.asarray(encodings, dtype=np.float32).reshape(-1, ENCODING_DIM))
+        count = len(self.encodings)
+
+        # sqrt(n) lists keeps both the centroid scan and each list scan small
+        self.n_lists = max(1, min(n_lists or int(np.sqrt(count)), count))
+        self.nprobe = nprobe
+
+        self.centroids = self._train_centroids(iterations, seed) if count else np.empty((0, ENCODING_DIM), np.float32)
+        self.centroid_sq_norms = np.einsum('ij,ij->i', self.centroids, self.centroids)
+        self._build_lists()
+
+    def __len__(self):
+        return len(self.encodings)
+
+    def _train_centroids(self, iterations, seed):
+        """Plain Lloyd's k-means seeded from random gallery rows"""
+        rng = np.random.default_rng(seed)
+        centroids = self.encodings[rng.choice(len(self.encodings), self.n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmin(pairwise_sq_distances(self.encodings, centroids, np.einsum('ij,ij->i', centroids, centroids)), axis=1)
+            counts = np.bincount(assignments, minlength=self.n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, self.encodings)
+            filled = counts > 0
+            new_centroids = centroids.copy()
+            new_centroids[filled] = sums[filled] / counts[filled, None]
+            if np.allclose(new_centroids, centroids):
+                break
+            centroids = new_centroids
+
+        return centroids
+
+    def _build_lists(self):
+        """Reorder rows so every inverted list is one contiguous block"""
+        if len(self.encodings) == 0:
+            self.assignments = np.empty(0, dtype=np.intp)
+            self.order = np.empty(0, dtype=np.intp)
+            self.offsets = np.zeros(self.n_lists + 1, dtype=np.intp)
+            self.list_encodings = self.encodings
+            self.list_sq_norms = np.empty(0, dtype=np.float32)
+            return
+
+        self.assignments = np.argmin(pairwise_sq_distances(self.encodings, self.centroids, self.centroid_sq_norms), axis=1)
+        self.order = np.argsort(self.assignments, kind='stable')
+        counts = np.bincount(self.assignments, minlength=self.n_lists)
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.list_encodings = np.ascontiguousarray(self.encodings[self.order])
+        self.list_sq_norms = np.einsum('ij,ij->i', self.list_encodings, self.list_encodings)
+
+    def search(self, queries, nprobe=None):
+        """Return (best_indices, best_distances) into the original row order"""
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, ENCODING_DIM)
+        best_indices = np.zeros(len(queries), dtype=np.intp)
+        best_sq_distances = np.full(len(queries), np.inf, dtype=np.float32)
+        if len(queries) == 0 or len(self.encodings) == 0:
+            return best_indices, np.sqrt(best_sq_distances)
+
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        centroid_distances = pairwise_sq_distances(queries, self.centroids, self.centroid_sq_norms)
+        probes = np.argpartition(centroid_distances, nprobe - 1, axis=1)[:, :nprobe]
+
+        # Score list by list so each step is one matrix product over a contiguous block
+        for list_id in np.unique(probes):
+            start, end = self.offsets[list_id], self.offsets[list_id + 1]
+            if start == end:
+                continue
+            query_ids = np.nonzero((probes == list_id).any(axis=1))[0]
+            sq_distances = pairwise_sq_distances(queries[query_ids], self.list_encodings[start:end], self.list_sq_norms[start:end])
+            local_best = np.argmin(sq_distances, axis=1)
+            local_sq_distances = sq_distances[np.arange(len(query_ids)), local_best]
+
+            improved = local_sq_distances < best_sq_distances[query_ids]
+            best_sq_distances[query_ids[improved]] = local_sq_distances[improved]
+            best_indices[query_ids[improved]] = self.order[start + local_best[improved]]
+
+        return best_indices, np.sqrt(best_sq_distances)
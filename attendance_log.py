@@ -0,0 +1,258 @@
+"""
+Attendance Log - Append-only attendance writes with a compacted JSON snapshot
+Saving a section's day appends one small event to a JSON-lines log and
+updates an in-memory materialized view, instead of rewriting every record
+ever taken. A background compactor periodically folds the log into
+attendance.json, which keeps its familiar {section: {date: {roll: status}}}
+layout for anything else that reads it.
+
+The view is copy-on-write: a write replaces the affected day, section and
+top-level dicts rather than changing them, so a view handed to a reader
+never changes underneath it. Readers must not modify it either. Changes to
+the snapshot or log made outside this process (another worker, a script, a
+hand edit) are noticed by their file mtime and size and reloaded. Appends
+and compactions of all processes sharing the files are serialized by a
+file lock next to the log, so a compaction never folds or removes events it
+has not seen.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from file_lock import FileLock
+from versioned_cache import file_version
+
+logger = logging.getLogger(__name__)
+
+
+def has_torn_tail(path):
+    """True if a non-empty file does not end with a newline"""
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except FileNotFoundError:
+        return False
+
+
+def line_complete(f, offset):
+    """True if the open file `f` is empty up to `offset` or its byte before `offset` is a newline"""
+    if offset == 0:
+        return True
+    f.seek(offset - 1)
+    return f.read(1) == b"\n"
+
+
+class AttendanceLog:
+    """attendance.json snapshot + append-only event log, materialized in memory"""
+
+    def __init__(self, snapshot_path, sections=(), log_path=None, compact_after=500, compact_interval=300.0,
+                 check_interval=1.0):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path or os.path.splitext(snapshot_path)[0] + ".log.jsonl"
+        self._compacting_path = self.log_path + ".compacting"
+        self.sections = list(sections)  # Sections present even in an empty snapshot
+        self.compact_after = compact_after  # Events that trigger a compaction before the interval is up
+        self.compact_interval = compact_interval
+        self.check_interval = check_interval  # How often view() looks for changes made by other processes
+
+        self.version = 0  # Bumped by every recorded event
+        self.pending_events = 0  # Events not yet folded into the snapshot
+        self._view = None
+        self._files = None  # (snapshot, log) file versions the view reflects
+        self._checked_at = 0.0
+        self._lock = threading.Lock()  # Serializes appends and view swaps
+        # Taken before _lock by appends and held through a whole compaction, across processes
+        self._file_lock = FileLock(self.log_path + ".lock")
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ----- reading -----
+
+    def view(self):
+        """Current {section: {date: {roll: status}}}; shared and never modified in place"""
+        view = self._view
+        if view is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return view
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if self._view is None or self._disk_files() != self._files:
+                if self._view is not None:
+                    logger.info("Attendance files changed outside this process, reloading")
+                self._view = self._load()
+            return self._view
+
+    def _disk_files(self):
+        return file_version(self.snapshot_path), file_version(self.log_path)
+
+    def _load(self, repair=False):
+        """Read snapshot + logs; only callers holding _file_lock may `repair` a torn tail"""
+        # Taken before reading: a write that lands meanwhile shows up as a change on the next check
+        files = self._disk_files()
+        self.pending_events = 0
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                view = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            view = {}
+        for section in self.sections:
+            view.setdefault(section, {})
+
+        # Events of an interrupted compaction come before the live log's
+        for path in (self._compacting_path, self.log_path):
+            for event in self._read_events(path, repair):
+                days = view.setdefault(event['section'], {})
+                day = {} if event.get('replace') else days.get(event['date'], {})
+                day.update(event['marks'])
+                days[event['date']] = day
+                self.pending_events += 1
+        # Cutting off a torn line changed the log
+        self._files = self._disk_files() if repair else files
+        return view
+
+    @staticmethod
+    def _read_events(path, repair=False):
+        """Events in a log file up to the first torn line
+
+        A torn last line is usually an append another process is still
+        writing, so readers leave it alone. With `repair` (under _file_lock, so
+        no append is in flight) it was left by a crash and is cut off, so the
+        next append starts on a clean line.
+        """
+        events = []
+        try:
+            with open(path, 'rb+' if repair else 'rb') as f:
+                good_offset = 0
+                for line in f:
+                    try:
+                        events.append(json.loads(line))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        if repair:
+                            logger.warning(f"Dropping torn attendance event at the end of {path}")
+                            f.truncate(good_offset)
+                        break
+                    good_offset += len(line)
+                if repair and not line_complete(f, good_offset):
+                    # The crash cut only the newline off a complete event
+                    f.write(b"\n")
+        except FileNotFoundError:
+            pass
+        return events
+
+    def _catch_up(self):
+        """Reload if the files changed or a crashed writer left a torn tail; needs _file_lock and _lock"""
+        if (self._view is None or self._disk_files() != self._files
+                or any(has_torn_tail(path) for path in (self._compacting_path, self.log_path))):
+            self._view = self._load(repair=True)
+
+    # ----- writing -----
+
+    def record(self, section, date_str, marks, replace=False):
+        """Append one section-day's {roll: status} marks; `replace` drops the day's other marks"""
+        event = {'section': section, 'date': date_str, 'marks': marks}
+        if replace:
+            event['replace'] = True
+        line = json.dumps(event, separators=(',', ':')) + "\n"
+
+        with self._file_lock, self._lock:
+            # Catch up first, or recording the log's new version would hide other processes' writes
+            self._catch_up()
+            with open(self.log_path, 'a') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Copy-on-write: O(students in the day + days in the section), never O(history)
+            view = self._view
+            days = view.get(section, {})
+            day = {} if replace else dict(days.get(date_str, {}))
+            day.update(marks)
+            self._view = {**view, section: {**days, date_str: day}}
+            self._files = self._disk_files()
+            self.version += 1
+            self.pending_events += 1
+            if self.pending_events >= self.compact_after:
+                self._wake.set()
+
+    # ----- compaction -----
+
+    def compact(self):
+        """Fold the log into the snapshot; True if there was anything to fold"""
+        with self._file_lock:
+            with self._lock:
+                # Another process may have appended or compacted since this view was loaded
+                self._catch_up()
+                if not self.pending_events:
+                    return False
+                view = self._view
+                # Rotated first, so a crash before the snapshot lands leaves every event on disk
+                if os.path.exists(self._compacting_path):
+                    self._append_file(self.log_path, self._compacting_path)
+                elif os.path.exists(self.log_path):
+                    os.replace(self.log_path, self._compacting_path)
+                self._files = self._disk_files()
+                folded = self.pending_events
+                self.pending_events = 0
+
+            try:
+                tmp_path = self.snapshot_path + ".tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(view, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                with self._lock:
+                    os.replace(tmp_path, self.snapshot_path)
+                    self._files = self._disk_files()
+                os.remove(self._compacting_path)
+            except OSError as e:
+                # The rotated events stay on disk and are folded next time
+                logger.error(f"Attendance compaction failed: {e}")
+                with self._lock:
+                    self.pending_events += folded
+                return False
+            logger.info(f"Compacted {folded} attendance events into {os.path.basename(self.snapshot_path)}")
+            return True
+
+    @staticmethod
+    def _append_file(source, target):
+        try:
+            with open(source, 'r') as f:
+                lines = f.read()
+        except FileNotFoundError:
+            return
+        with open(target, 'a') as f:
+            f.write(lines)
+        os.remove(source)
+
+    def start(self):
+        """Start the background compactor (idempotent)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._compact_loop, daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """Stop the compactor and fold whatever is left"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10.0)
+        self.compact()
+
+    def _compact_loop(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.compact_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.compact()
+            except Exception as e:
+                logger.error(f"Attendance compactor error: {e}")
@@ -0,0 +1,194 @@
+"""
+Attendance Matrix - Columnar per-section attendance with vectorized analytics
+Each section's {date: {roll: status}} records are laid out once as dense
+int8 matrices with one row per roll of the section (its RollResolver row):
+
+    days      students × dates     the day's mark of each student
+    sessions  students × sessions  one column per timetabled (date, subject)
+                                   class; a "<subject>_<roll>" mark wins over
+                                   the day's mark, as in the student history
+
+A cell is 1 (present), 0 (absent) or NC (no mark / not conducted), so
+percentages, streaks, daily rates and weekly trends are single NumPy
+reductions instead of walks over nested dicts. Matrices are cached per
+section and rebuilt only when the section's records are a different object;
+the copy-on-write attendance view replaces a section's dict whenever one of
+its days changes.
+"""
+
+import threading
+from datetime import datetime
+
+import numpy as np
+
+NC = -1  # Not conducted, or no mark for the student
+
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def mark_value(status):
+    """Cell value of a stored status: 1, 0 or NC"""
+    if status == 1:
+        return 1
+    if status == 0:
+        return 0
+    return NC
+
+
+class SectionMatrix:
+    """Dense attendance of one section; arrays are shared and read-only"""
+
+    def __init__(self, section_id, code, student_count, records, resolver, timetable):
+        self.section = section_id
+        self.student_count = student_count
+        self.rolls = resolver.rolls(section_id)  # Roll of each row
+
+        dated = []
+        for date_str in records:
+            try:
+                dated.append((datetime.strptime(date_str, "%Y-%m-%d"), date_str))
+            except (ValueError, TypeError):
+                continue
+        dated.sort()
+        self.date_strings = [date_str for _, date_str in dated]
+        self.dates = np.array([date.date() for date, _ in dated], dtype='datetime64[D]')
+
+        self.days = np.full((student_count, len(dated)), NC, dtype=np.int8)
+        slots = {}  # Mark key -> (row, subject or None), or None for keys of other sections
+        session_columns = []
+        session_dates = []
+        subject_codes = {}
+        session_subjects = []
+        for column, (date, date_str) in enumerate(dated):
+            day_rows, day_values, subject_marks = self._day_marks(records[date_str], code, resolver, slots)
+            self.days[day_rows, column] = day_values
+
+            # A subject listed twice on a weekday is still one class
+            for subject in dict.fromkeys(timetable.get(WEEKDAYS[date.weekday()], [])):
+                session = self.days[:, column].copy()
+                rows, values = subject_marks.get(subject, ((), ()))
+                session[list(rows)] = values
+                session_columns.append(session)
+                session_dates.append(column)
+                session_subjects.append(subject_codes.setdefault(subject, len(subject_codes)))
+        self.subjects = list(subject_codes)
+
+        if session_columns:
+            self.sessions = np.stack(session_columns, axis=1)
+        else:
+            self.sessions = np.full((student_count, 0), NC, dtype=np.int8)
+        self.session_dates = np.array(session_dates, dtype=np.int32)  # Column in `dates` of each session
+        self.session_subjects = np.array(session_subjects, dtype=np.int16)  # Index in `subjects`
+
+        for array in (self.dates, self.days, self.sessions, self.session_dates, self.session_subjects):
+            array.flags.writeable = False
+
+    def _day_marks(self, marks, code, resolver, slots):
+        """(rows, values) of the day's roll marks plus {subject: (rows, values)} of its subject marks"""
+        # Days repeat the same keys, so each key is resolved once per build
+        unseen = [key for key in marks if key not in slots]
+        if unseen:
+            rolls = [key.rpartition('_')[2] for key in unseen]
+            codes, rows = resolver.resolve_many(rolls)
+            for key, roll, key_code, row in zip(unseen, rolls, codes, rows):
+                # Marks are keyed by the exact roll string, so "23CSEDS1" is not 23CSEDS001's
+                if key_code < 0 or key_code != code or roll != self.rolls[row]:
+                    slots[key] = None
+                else:
+                    slots[key] = (int(row), key[:-len(roll) - 1] if len(key) > len(roll) else None)
+
+        day_rows, day_values = [], []
+        subject_marks = {}
+        for key, status in marks.items():
+            slot = slots[key]
+            if slot is None:
+                continue
+            row, subject = slot
+            if subject is None:
+                day_rows.append(row)
+                day_values.append(mark_value(status))
+            else:
+                subject_rows, subject_values = subject_marks.setdefault(subject, ([], []))
+                subject_rows.append(row)
+                subject_values.append(mark_value(status))
+        return day_rows, day_values, subject_marks
+
+    # ----- per student, over timetabled classes -----
+
+    def conducted(self):
+        """Classes with a mark, per student"""
+        return (self.sessions != NC).sum(axis=1)
+
+    def attended(self):
+        return (self.sessions == 1).sum(axis=1)
+
+    def percentages(self):
+        """Attendance % of every student over conducted classes, 0 where none were"""
+        conducted = self.conducted()
+        rates = self.attended() * 100.0 / np.maximum(conducted, 1)
+        return np.where(conducted > 0, np.round(rates, 1), 0.0)
+
+    def percentage(self, row):
+        """Attendance % of one student, rounded like the rest of the app"""
+        student = self.sessions[row]
+        conducted = int((student != NC).sum())
+        if conducted == 0:
+            return 0
+        return round(int((student == 1).sum()) / conducted * 100, 1)
+
+    def current_streaks(self):
+        """Classes attended in a row since each student's last absence, NC classes skipped"""
+        index = np.arange(self.sessions.shape[1])
+        last_absence = np.where(self.sessions == 0, index, -1).max(axis=1, initial=-1)
+        return ((self.sessions == 1) & (index > last_absence[:, None])).sum(axis=1)
+
+    # ----- per date, over day marks -----
+
+    def daily_present(self):
+        """Students marked present on each date"""
+        return (self.days == 1).sum(axis=0)
+
+    def daily_rates(self):
+        """% of the section present on each date"""
+        if self.student_count == 0:
+            return np.zeros(len(self.dates))
+        return np.round(self.daily_present() * 100.0 / self.student_count, 2)
+
+    def weekly(self):
+        """(week start dates, students present, days recorded) per week that has records"""
+        if len(self.dates) == 0:
+            return self.dates, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        # 1970-01-01 was a Thursday, so day number + 3 counts from a Monday
+        week_starts = self.dates - ((self.dates.astype(np.int64) + 3) % 7).astype('timedelta64[D]')
+        weeks, week_of_date = np.unique(week_starts, return_inverse=True)
+        present = np.bincount(week_of_date, weights=self.daily_present(), minlength=len(weeks)).astype(np.int64)
+        days = np.bincount(week_of_date, minlength=len(weeks))
+        return weeks, present, days
+
+
+class AttendanceMatrices:
+    """SectionMatrix cache over the shared attendance view"""
+
+    def __init__(self, resolver, timetable):
+        self.resolver = resolver
+        self.timetable = timetable  # {section_id: {weekday: [subject, ...]}}
+        self.builds = 0
+        self._cache = {}  # section_id -> (records object it was built from, SectionMatrix)
+        self._lock = threading.Lock()
+
+    def section(self, section_id, records):
+        """Matrix of a section's {date: {roll: status}} records; rebuilt only for a new records object"""
+        records = records or {}
+        cached = self._cache.get(section_id)
+        if cached and (cached[0] is records or not (cached[0] or records)):
+            return cached[1]
+
+        code = self.resolver.code_of(section_id)
+        student_count = int(self.resolver.sizes[code]) if code >= 0 else 0
+        matrix = SectionMatrix(section_id, code, student_count, records, self.resolver,
+                               self.timetable.get(section_id, {}))
+        with self._lock:
+            # Holding the records keeps their identity from being reused by a new object
+            self._cache[section_id] = (records, matrix)
+            self.builds += 1
+        return matrix
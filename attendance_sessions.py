@@ -0,0 +1,142 @@
+"""
+Attendance Sessions - Registry of concurrent face attendance sessions
+Each session is keyed by a section or room id and owns its own camera
+processor (and with it the gallery slice) and its own set of present students,
+so one server can run face attendance for many classrooms at once.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from session_events import SessionEventLog
+
+
+class AttendanceSession:
+    """One classroom's face attendance session"""
+
+    def __init__(self, session_id, section, started_by=None):
+        self.session_id = session_id
+        self.section = section
+        self.started_by = started_by
+        self.started_at = datetime.now().isoformat()
+        self.camera_processor = None
+        self.present_students = set()
+        self.lock = threading.Lock()  # Guards present_students between requests and the recognition thread
+        self.evidence = None  # PresenceEvidence votes shared by every camera run of the session
+        self.events = SessionEventLog()  # Change feed streamed to dashboards over Server-Sent Events
+
+    @property
+    def is_running(self):
+        return self.camera_processor is not None and self.camera_processor.is_running
+
+    def begin_run(self, started_by, camera_processor):
+        """Attach a new camera run; it starts from a clean slate, the previous run was saved when it stopped"""
+        self.started_by = started_by
+        self.started_at = datetime.now().isoformat()
+        self.present_students = camera_processor.present_students
+        self.evidence = camera_processor.evidence
+        camera_processor.events = self.events
+        camera_processor.present_lock = self.lock
+        self.camera_processor = camera_processor
+
+    def mark_present(self, students):
+        """Add students to the present set; returns those not present before, sorted"""
+        with self.lock:
+            newly_present = sorted(set(students) - self.present_students)
+            self.present_students.update(newly_present)
+            return newly_present
+
+    def stop(self):
+        """Stop the camera but keep the present set for saving and export"""
+        if self.camera_processor:
+            self.camera_processor.stop_processing()
+            self.camera_processor = None
+
+    def to_dict(self):
+        return {
+            'session_id': self.session_id,
+            'section': self.section,
+            'started_by': self.started_by,
+            'started_at': self.started_at,
+            'running': self.is_running,
+            'gallery_version': self.camera_processor.gallery_version if self.camera_processor else None,
+            'present_count': len(self.present_students)
+        }
+
+
+class AttendanceSessionRegistry:
+    """Thread-safe map of session id -> AttendanceSession"""
+
+    def __init__(self):
+        self._sessions = {}
+        self._starting = set()  # Ids whose camera is being opened by a request
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        with self._lock:
+            return self._sessions.get(session_id)
+
+    def get_or_create(self, session_id, section, started_by=None):
+        with self._lock:
+            attendance_session = self._sessions.get(session_id)
+            if attendance_session is None:
+                attendance_session = AttendanceSession(session_id, section, started_by)
+                self._sessions[session_id] = attendance_session
+            return attendance_session
+
+    @contextmanager
+    def starting(self, session_id):
+        """Claim a session id for one start at a time; yields False if it is running or already being started"""
+        with self._lock:
+            existing = self._sessions.get(session_id)
+            claimed = session_id not in self._starting and not (existing and existing.is_running)
+            if claimed:
+                self._starting.add(session_id)
+        try:
+            yield claimed
+        finally:
+            if claimed:
+                with self._lock:
+                    self._starting.discard(session_id)
+
+    def add(self, attendance_session):
+        """Register a session; returns the one registered under its id, which may be another"""
+        with self._lock:
+            return self._sessions.setdefault(attendance_session.session_id, attendance_session)
+
+    def latest_for_user(self, username):
+        """Most recently started session of a user, for clients that send no session id"""
+        with self._lock:
+            owned = [s for s in self._sessions.values() if s.started_by == username]
+        return max(owned, key=lambda s: s.started_at) if owned else None
+
+    def present_for_section(self, section):
+        """Union of the present sets of every session for a section"""
+        with self._lock:
+            sessions = [s for s in self._sessions.values() if s.section == section]
+        present = set()
+        for attendance_session in sessions:
+            with attendance_session.lock:
+                present |= attendance_session.present_students
+        return present
+
+    def remove(self, session_id):
+        with self._lock:
+            attendance_session = self._sessions.pop(session_id, None)
+        if attendance_session:
+            attendance_session.stop()
+            attendance_session.events.close()
+        return attendance_session
+
+    def remove_for_user(self, username):
+        """Stop and drop only the sessions this user started"""
+        with self._lock:
+            owned = [s.session_id for s in self._sessions.values() if s.started_by == username]
+        for session_id in owned:
+            self.remove(session_id)
+        return len(owned)
+
+    def list(self):
+        with self._lock:
+            return list(self._sessions.values())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+ANN Gallery Benchmark
+Compares IVF approximate search against exact brute force on database/encodings.pkl.
+The real gallery can be replicated with jitter to simulate campus-scale enrollment.
+
+Usage:
+    python benchmark_ann.py --replicate 40 --nprobe 1 2 4 8 16
+"""
+import argparse
+import os
+import pickle
+import time
+
+import numpy as np
+
+from ann_index import IVFIndex
+from face_matcher import FaceMatcher
+
+ENCODINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "database", "encodings.pkl")
+
+
+def build_gallery(replicate, jitter, rng):
+    """Load encodings.pkl and optionally grow it with jittered copies"""
+    with open(ENCODINGS_FILE, 'rb') as f:
+        data = pickle.load(f)
+    base = np.asarray(data["encodings"], dtype=np.float32)
+
+    copies = [base] + [base + rng.normal(0, jitter, base.shape).astype(np.float32) for _ in range(replicate - 1)]
+    return np.concatenate(copies)
+
+
+def time_search(search, queries, repeats):
+    """Return (results, mean milliseconds per query)"""
+    results = search(queries)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        search(queries)
+    elapsed = (time.perf_counter() - start) / repeats
+    return results, elapsed * 1000 / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IVF gallery search against exact search")
+    parser.add_argument('--replicate', type=int, default=1, help="Gallery copies (1 = encodings.pkl as-is)")
+    parser.add_argument('--jitter', type=float, default=0.05, help="Std-dev of noise added to replicated rows")
+    parser.add_argument('--queries', type=int, default=200, help="Number of probe faces")
+    parser.add_argument('--n-lists', type=int, default=None, help="IVF clusters (default sqrt(gallery size))")
+    parser.add_argument('--nprobe', type=int, nargs='+', default=[1, 2, 4, 8, 16], help="Recall/latency settings to sweep")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    gallery = build_gallery(args.replicate, args.jitter, rng)
+
+    # Probe faces are gallery rows seen again under a little camera noise
+    rows = rng.choice(len(gallery), min(args.queries, len(gallery)), replace=False)
+    queries = gallery[rows] + rng.normal(0, 0.02, (len(rows), gallery.shape[1])).astype(np.float32)
+
+    exact = FaceMatcher(gallery, [str(i) for i in range(len(gallery))])
+    (exact_indices, _), exact_ms = time_search(exact.match, queries, args.repeats)
+
+    start = time.perf_counter()
+    index = IVFIndex(gallery, n_lists=args.n_lists)
+    build_seconds = time.perf_counter() - start
+
+    print(f"Gallery: {len(gallery)} encodings, {index.n_lists} IVF lists (built in {build_seconds:.2f}s)")
+    print(f"Queries: {len(queries)}")
+    print("-" * 52)
+    print(f"{'mode':<14}{'recall@1':>12}{'ms/query':>12}{'speedup':>12}")
+    print(f"{'exact':<14}{1.0:>12.3f}{exact_ms:>12.4f}{1.0:>12.2f}")
+
+    for nprobe in args.nprobe:
+        (ivf_indices, _), ivf_ms = time_search(lambda q: index.search(q, nprobe=nprobe), queries, args.repeats)
+        recall = np.mean(ivf_indices == exact_indices)
+        print(f"{'ivf/' + str(nprobe):<14}{recall:>12.3f}{ivf_ms:>12.4f}{exact_ms / ivf_ms:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
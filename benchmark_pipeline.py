@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Recognition Pipeline Benchmark
+Feeds synthetic or recorded frames through the CameraProcessor recognition path
+(resize, colour conversion, HOG detection, encoding, gallery matching) on the CPU
+and reports per-stage latency percentiles, frames/sec and faces/sec while gallery
+size, faces per frame and resolution vary. Runs headless, so CI can compare a run
+against a saved baseline and fail on regressions.
+
+Synthetic frames carry no real faces: detection is timed on the full frame and
+encoding is timed on planted face boxes, matched against encodings.pkl rows.
+
+Usage:
+    python benchmark_pipeline.py --resolutions 640x480 1280x720 --faces 1 5 20 --gallery-sizes 254 5000
+    python benchmark_pipeline.py --source recordings/lecture.mp4 --frames 100
+    python benchmark_pipeline.py --output bench.json --baseline ci/bench_baseline.json --max-regression 0.25
+"""
+import argparse
+import itertools
+import json
+import math
+import time
+
+import cv2
+import numpy as np
+
+from benchmark_ann import build_gallery
+from face_matcher import FaceMatcher
+from face_pipeline import detect_faces, encode_faces, scale_box
+from frame_sources import open_frame_source
+
+STAGES = ('resize', 'convert', 'detect', 'encode', 'match', 'total')
+
+
+def percentiles(samples):
+    """p50/p90/p99 in milliseconds"""
+    values = np.asarray(samples) * 1000
+    return {f'p{q}': float(np.percentile(values, q)) for q in (50, 90, 99)}
+
+
+def synthetic_frames(width, height, count, rng):
+    """Textured noise frames at camera resolution"""
+    base = rng.integers(0, 256, (height // 8, width // 8, 3), dtype=np.uint8)
+    frames = []
+    for _ in range(count):
+        noise = rng.integers(-20, 20, base.shape, dtype=np.int16)
+        frame = np.clip(base.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        frames.append(cv2.resize(frame, (width, height), interpolation=cv2.INTER_LINEAR))
+    return frames
+
+
+def recorded_frames(source, count):
+    """Every frame of a video file or image directory, in order"""
+    frame_source = open_frame_source(source)
+    success, message = frame_source.start()
+    if not success:
+        raise SystemExit(message)
+
+    frames = []
+    while len(frames) < count:
+        ret, frame = frame_source.read(timeout=5.0)
+        if not ret:
+            break
+        frames.append(frame.copy())  # Views into the source's ring are reused after a few frames
+    frame_source.release()
+    if not frames:
+        raise SystemExit(f"No frames read from {source}")
+    return frames
+
+
+def planted_boxes(height, width, faces):
+    """Grid of (top, right, bottom, left) face boxes sized like a seated class"""
+    columns = math.ceil(math.sqrt(faces))
+    rows = math.ceil(faces / columns)
+    size = max(min(height // (rows + 1), width // (columns + 1), height // 3), 24)
+    boxes = []
+    for r, c in itertools.product(range(rows), range(columns)):
+        top = int((r + 0.5) * height / rows - size / 2)
+        left = int((c + 0.5) * width / columns - size / 2)
+        boxes.append((top, left + size, top + size, left))
+    return boxes[:faces]
+
+
+def run_case(frames, matcher, probe_encodings, faces, rng, detect_scale=0.5, encode_full_resolution=True):
+    """Time each stage of the recognition path for every frame"""
+    timings = {stage: [] for stage in STAGES}
+    faces_seen = 0
+
+    for frame in frames:
+        start = time.perf_counter()
+        small_frame = cv2.resize(frame, (0, 0), fx=detect_scale, fy=detect_scale)
+        resized = time.perf_counter()
+        rgb_small_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+        converted = time.perf_counter()
+        face_locations = detect_faces(rgb_small_frame)
+        detected = time.perf_counter()
+
+        if faces is not None:
+            face_locations = planted_boxes(small_frame.shape[0], small_frame.shape[1], faces)
+        if encode_full_resolution:
+            # Same cascade as recognize_frame: boxes mapped back, encoded on the full frame
+            face_locations = [scale_box(location, 1 / detect_scale) for location in face_locations]
+            face_encodings = encode_faces(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), face_locations) if face_locations else []
+        else:
+            face_encodings = encode_faces(rgb_small_frame, face_locations)
+        encoded = time.perf_counter()
+
+        if faces is not None:
+            # Synthetic crops encode to noise, so match realistic probes instead
+            face_encodings = probe_encodings[rng.integers(0, len(probe_encodings), len(face_locations))]
+        matcher.identify(face_encodings)
+        matched = time.perf_counter()
+
+        faces_seen += len(face_locations)
+        for stage, seconds in zip(STAGES, (resized - start, converted - resized, detected - converted,
+                                           encoded - detected, matched - encoded, matched - start)):
+            timings[stage].append(seconds)
+
+    total_seconds = sum(timings['total'])
+    return {
+        'frames': len(frames),
+        'faces': faces_seen,
+        'fps': len(frames) / total_seconds,
+        'faces_per_second': faces_seen / total_seconds,
+        'stages': {stage: percentiles(samples) for stage, samples in timings.items()}
+    }
+
+
+def compare_to_baseline(results, baseline, max_regression):
+    """Return the cases whose total p50 got slower than the allowed fraction"""
+    previous = {case['case']: case for case in baseline}
+    regressions = []
+    for case in results:
+        old = previous.get(case['case'])
+        if old is None:
+            continue
+        old_p50 = old['stages']['total']['p50']
+        new_p50 = case['stages']['total']['p50']
+        if new_p50 > old_p50 * (1 + max_regression):
+            regressions.append(f"{case['case']}: total p50 {old_p50:.1f}ms -> {new_p50:.1f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the face recognition pipeline stage by stage")
+    parser.add_argument('--source', default=None, help="Video file or image directory to replay instead of synthetic frames")
+    parser.add_argument('--resolutions', nargs='+', default=['640x480', '1280x720'], help="Synthetic camera resolutions")
+    parser.add_argument('--faces', type=int, nargs='+', default=[1, 5, 20], help="Synthetic faces per frame")
+    parser.add_argument('--gallery-sizes', type=int, nargs='+', default=[254, 5000], help="Gallery rows to match against")
+    parser.add_argument('--frames', type=int, default=20, help="Frames per case")
+    parser.add_argument('--warmup', type=int, default=2, help="Untimed frames before each case")
+    parser.add_argument('--index-mode', choices=['exact', 'ivf'], default='exact')
+    parser.add_argument('--detect-scale', type=float, default=0.5, help="Downscale factor for HOG detection")
+    parser.add_argument('--encode-small', action='store_true', help="Encode on the detection frame instead of full resolution")
+    parser.add_argument('--output', default=None, help="Write results as JSON")
+    parser.add_argument('--baseline', default=None, help="Earlier --output file to compare against")
+    parser.add_argument('--max-regression', type=float, default=0.25, help="Allowed slowdown of total p50 (0.25 = 25%%)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    if args.source:
+        inputs = [(args.source, None, recorded_frames(args.source, args.frames + args.warmup))]
+    else:
+        inputs = []
+        for resolution in args.resolutions:
+            width, height = (int(v) for v in resolution.lower().split('x'))
+            frames = synthetic_frames(width, height, args.frames + args.warmup, rng)
+            inputs.extend((resolution, faces, frames) for faces in args.faces)
+
+    results = []
+    print(f"{'case':<34}{'fps':>8}{'faces/s':>9}" + ''.join(f"{stage + ' p50/p90':>18}" for stage in STAGES[2:]))
+    enrolled = len(build_gallery(1, 0.0, rng))
+    for gallery_size in args.gallery_sizes:
+        # Galleries larger than encodings.pkl are grown with jittered copies
+        gallery = build_gallery(math.ceil(gallery_size / enrolled), 0.05, rng)[:gallery_size]
+        matcher = FaceMatcher(gallery, [str(i) for i in range(len(gallery))], index_mode=args.index_mode)
+        probe_encodings = gallery + rng.normal(0, 0.02, gallery.shape).astype(np.float32)
+
+        for label, faces, frames in inputs:
+            cascade = {'detect_scale': args.detect_scale, 'encode_full_resolution': not args.encode_small}
+            run_case(frames[:args.warmup], matcher, probe_encodings, faces, rng, **cascade)
+            result = run_case(frames[args.warmup:], matcher, probe_encodings, faces, rng, **cascade)
+            result['case'] = f"{label} faces={faces if faces is not None else 'detected'} gallery={gallery_size}"
+            results.append(result)
+
+            stage_columns = ''.join(f"{result['stages'][stage]['p50']:>9.1f}{result['stages'][stage]['p90']:>9.1f}"
+                                    for stage in STAGES[2:])
+            print(f"{result['case']:<34}{result['fps']:>8.2f}{result['faces_per_second']:>9.1f}{stage_columns}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(results, json.load(f), args.max_regression)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            raise SystemExit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
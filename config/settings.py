@@ -0,0 +1,29 @@
+"""
+Settings - File paths and section configuration shared by the app and its tools
+Kept free of heavy imports so command-line tools (enrollment) can use the
+same database paths and SECTIONS without importing the Flask app.
+"""
+
+import os
+
+# Define application root directory
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATABASE_DIR = os.path.join(APP_ROOT, "database")
+
+# File paths
+ENCODINGS_FILE = os.path.join(DATABASE_DIR, "encodings.pkl")
+ENCODINGS_STORE_DIR = os.path.join(DATABASE_DIR, "gallery")
+PHOTOS_DIR = os.path.join(DATABASE_DIR, "student_photos")
+ENROLLMENT_CACHE_FILE = os.path.join(DATABASE_DIR, "enrollment_cache.pkl")
+USERS_FILE = os.path.join(DATABASE_DIR, "users.json")
+DETAILS_FILE = os.path.join(DATABASE_DIR, "details.json")
+ATTENDANCE_FILE = os.path.join(DATABASE_DIR, "attendance.json")
+PRESENCE_EVIDENCE_FILE = os.path.join(DATABASE_DIR, "attendance_evidence.json")
+
+# Section configurations
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 60, "name": "CSE-DS"},
+    "CSEAIML_A": {"prefix": "23CSEAIML", "start": 1, "end": 64, "name": "CSE AIML-A"},
+    "CSEAIML_B": {"prefix": "23CSEAIML", "start": 65, "end": 128, "name": "CSE AIML-B"},
+    "CSEAIML_C": {"prefix": "23CSEAIML", "start": 129, "end": 204, "name": "CSE AIML-C"}
+}
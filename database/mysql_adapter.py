@@ -197,6 +197,13 @@ class EduvisionMySQLAdapter:
             return attendance
         return {}
     
+    def get_attendance_change_marker(self):
+        """(row count, latest marked_at) of the attendance table; changes whenever attendance is saved"""
+        result = self.execute_query("SELECT COUNT(*) AS row_count, MAX(marked_at) AS last_marked FROM attendance")
+        if result:
+            return result[0]['row_count'], result[0]['last_marked']
+        return None
+    
     def get_student_attendance_history(self, roll_number):
         """Get attendance history for a student"""
         query = """
@@ -0,0 +1,188 @@
+"""
+Encoding Store - Memory-mapped, section-indexed face gallery
+Replaces unpickling the whole encodings.pkl on every attendance session.
+
+On-disk layout (one directory per published gallery version):
+    CURRENT               name of the live version directory, swapped atomically
+    v000001/encodings.npy float32 matrix, one 128-d row per enrolled face,
+                          rows grouped contiguously by section
+    v000001/names.npy     roll number for every row
+    v000001/index.json    {section_id: [first_row, end_row]} plus build metadata
+"""
+
+import json
+import os
+import pickle
+import shutil
+import threading
+
+import numpy as np
+
+from face_matcher import ENCODING_DIM
+from file_lock import FileLock
+from roll_resolver import RollResolver
+
+UNASSIGNED_SECTION = "_unassigned"
+
+
+class EncodingStore:
+    """Section-indexed gallery opened with mmap so sessions only touch their slice"""
+
+    ENCODINGS_NAME = "encodings.npy"
+    NAMES_NAME = "names.npy"
+    INDEX_NAME = "index.json"
+    CURRENT_NAME = "CURRENT"
+    LOCK_NAME = ".build.lock"
+
+    def __init__(self, store_dir, sections, keep_versions=2):
+        self.store_dir = store_dir
+        self.sections = sections
+        self.resolver = RollResolver(sections)
+        self.keep_versions = keep_versions  # Older versions stay on disk for sessions still mapping them
+        self.lock = threading.Lock()
+        # Builders in any thread or process (enrollment, the gallery watcher, the CLI) publish one at a time
+        self.build_lock = FileLock(self._path(self.LOCK_NAME))
+        self._version = None
+        self._encodings = None
+        self._names = None
+        self._index = None
+
+    def _path(self, *names):
+        return os.path.join(self.store_dir, *names)
+
+    @staticmethod
+    def _version_dir(version):
+        return f"v{version:06d}"
+
+    def current_version(self):
+        """Number of the published gallery version, 0 when nothing is published"""
+        try:
+            with open(self._path(self.CURRENT_NAME), 'r') as f:
+                return int(f.read().strip().lstrip('v'))
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def metadata(self):
+        """Build metadata of the published version, or None"""
+        version = self.current_version()
+        if not version:
+            return None
+        try:
+            with open(self._path(self._version_dir(version), self.INDEX_NAME), 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    # ========== BUILD ==========
+
+    def build_from_pickle(self, pickle_path):
+        """Convert a legacy {"encodings", "names"} pickle into the store layout"""
+        with open(pickle_path, 'rb') as f:
+            data = pickle.load(f)
+        return self.build(data["encodings"], data["names"], source_mtime=os.path.getmtime(pickle_path))
+
+    def rebuild_if_stale(self, pickle_path):
+        """build_from_pickle unless another builder already published this pickle; returns the version or None"""
+        with self.build_lock:
+            if not self.is_stale(pickle_path):
+                return None
+            return self.build_from_pickle(pickle_path)
+
+    def build(self, encodings, names, source_mtime=None):
+        """Publish encodings grouped by section as a new gallery version, returns its number"""
+        with self.build_lock:
+            return self._build(encodings, names, source_mtime)
+
+    def _build(self, encodings, names, source_mtime):
+        grouped = {section_id: [] for section_id in self.sections}
+        grouped[UNASSIGNED_SECTION] = []
+        for row, section_id in enumerate(self.resolver.sections_of(names)):
+            grouped[section_id or UNASSIGNED_SECTION].append(row)
+
+        order = []
+        index = {}
+        for section_id, rows in grouped.items():
+            if rows:
+                index[section_id] = [len(order), len(order) + len(rows)]
+                order.extend(rows)
+
+        matrix = np.asarray(encodings, dtype=np.float32).reshape(len(names), ENCODING_DIM)[order]
+        name_array = np.asarray([names[row] for row in order], dtype=str)
+
+        # A complete version directory is written first, then CURRENT is swapped to it,
+        # so readers see either the whole old gallery or the whole new one
+        version = self._next_version()
+        version_dir = self._version_dir(version)
+        tmp_dir = self._path(version_dir + ".tmp")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        np.save(os.path.join(tmp_dir, self.ENCODINGS_NAME), matrix)
+        np.save(os.path.join(tmp_dir, self.NAMES_NAME), name_array)
+        metadata = {'version': version, 'sections': index, 'count': len(order), 'source_mtime': source_mtime}
+        with open(os.path.join(tmp_dir, self.INDEX_NAME), 'w') as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_dir, self._path(version_dir))
+
+        current_tmp = self._path(self.CURRENT_NAME + ".tmp")
+        with open(current_tmp, 'w') as f:
+            f.write(version_dir)
+        os.replace(current_tmp, self._path(self.CURRENT_NAME))
+
+        self._remove_old_versions(version)
+        return version
+
+    def _next_version(self):
+        """One past every version directory on disk, including one a crash left unpublished"""
+        latest = self.current_version()
+        try:
+            entries = os.listdir(self.store_dir)
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if entry.startswith('v') and entry[1:].isdigit():
+                latest = max(latest, int(entry[1:]))
+        return latest + 1
+
+    def _remove_old_versions(self, current):
+        for version in range(max(current - self.keep_versions - 5, 1), current - self.keep_versions + 1):
+            # Windows refuses to delete files that are still mapped; they are retried next build
+            shutil.rmtree(self._path(self._version_dir(version)), ignore_errors=True)
+
+    def is_stale(self, pickle_path):
+        """True when the store is missing or older than the legacy pickle"""
+        metadata = self.metadata()
+        if metadata is None:
+            return True
+        if not os.path.exists(pickle_path):
+            return False
+        return metadata.get('source_mtime') != os.path.getmtime(pickle_path)
+
+    # ========== READ ==========
+
+    def _open(self):
+        """Map the published version once; pages are only read in when a slice is touched"""
+        version = self.current_version()
+        if not version:
+            raise FileNotFoundError(self._path(self.CURRENT_NAME))
+        with self.lock:
+            if self._version != version:
+                version_dir = self._path(self._version_dir(version))
+                with open(os.path.join(version_dir, self.INDEX_NAME), 'r') as f:
+                    self._index = json.load(f)['sections']
+                self._encodings = np.load(os.path.join(version_dir, self.ENCODINGS_NAME), mmap_mode='r')
+                self._names = np.load(os.path.join(version_dir, self.NAMES_NAME), mmap_mode='r')
+                self._version = version
+            return self._encodings, self._names, self._index
+
+    def load_section(self, section_id):
+        """Return (encodings, names) for one section as a read-only mmap slice"""
+        try:
+            encodings, names, index = self._open()
+        except FileNotFoundError:
+            return np.empty((0, ENCODING_DIM), dtype=np.float32), []
+
+        if section_id not in index:
+            return np.empty((0, ENCODING_DIM), dtype=np.float32), []
+
+        start, end = index[section_id]
+        return encodings[start:end], [str(name) for name in names[start:end]]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Enrollment - Incremental, parallel face gallery builder
+Scans a directory of student photos named by roll number (23CSEDS001.jpg,
+23CSEDS001_2.jpg, ...), encodes only photos whose content hash has not been
+seen before across a process pool, writes database/encodings.pkl atomically and
+publishes the result as a new EncodingStore version.
+
+Rolls without any photo in the directory keep their existing encodings.pkl
+rows, so a partial photo folder never un-enrolls anyone. Photos whose name is
+not a roll number of a configured section (IMG1234.jpg) are reported and
+left out instead of becoming phantom students.
+
+Usage:
+    python enrollment.py --photos database/student_photos
+    python enrollment.py --photos new_admissions --workers 4
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import pickle
+import re
+import time
+
+import face_recognition
+import numpy as np
+
+from config.settings import ENCODINGS_FILE, ENCODINGS_STORE_DIR, ENROLLMENT_CACHE_FILE, PHOTOS_DIR, SECTIONS
+from encoding_store import EncodingStore
+from face_pipeline import detect_faces, encode_faces
+from file_lock import FileLock
+from recognition_pool import make_executor
+
+logger = logging.getLogger(__name__)
+
+PHOTO_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+# Roll number, optionally followed by _<n> for extra photos of the same student
+PHOTO_NAME_PATTERN = re.compile(r'^([A-Za-z0-9]+?)(?:_[A-Za-z0-9-]+)?$')
+
+
+def roll_for_photo(filename):
+    """Roll number a photo file is named after, or None"""
+    stem, extension = os.path.splitext(os.path.basename(filename))
+    if extension.lower() not in PHOTO_EXTENSIONS:
+        return None
+    match = PHOTO_NAME_PATTERN.match(stem)
+    return match.group(1).upper() if match else None
+
+
+def file_digest(path):
+    """SHA-256 of a photo's bytes, so renamed or re-copied photos are not re-encoded"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode_photo(path):
+    """Worker: (status, encoding) for the largest face in one photo"""
+    try:
+        image = face_recognition.load_image_file(path)
+        face_locations = detect_faces(image)
+        if not face_locations:
+            return 'no_face', None
+        # Group shots or a bystander in the frame: enroll the most prominent face
+        largest = max(face_locations, key=lambda box: (box[2] - box[0]) * (box[1] - box[3]))
+        encoding = encode_faces(image, [largest])[0]
+        status = 'ok' if len(face_locations) == 1 else 'multiple_faces'
+        return status, np.asarray(encoding, dtype=np.float32)
+    except Exception as e:
+        return f'error: {e}', None
+
+
+def _write_pickle_atomic(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class Enroller:
+    """Builds the gallery from a photo directory, re-encoding only new or changed photos"""
+
+    def __init__(self, store, photos_dir=PHOTOS_DIR, encodings_file=ENCODINGS_FILE,
+                 cache_file=ENROLLMENT_CACHE_FILE, workers=None):
+        self.store = store
+        self.photos_dir = photos_dir
+        self.encodings_file = encodings_file
+        self.cache_file = cache_file
+        self.workers = workers or os.cpu_count() or 1
+        # One run at a time per gallery across processes (app workers and the CLI)
+        self.run_lock = FileLock(encodings_file + ".lock")
+
+    def scan(self):
+        """[(path, roll)] for every correctly named photo, in a stable order"""
+        photos = []
+        if not os.path.isdir(self.photos_dir):
+            return photos
+        for filename in sorted(os.listdir(self.photos_dir)):
+            roll = roll_for_photo(filename)
+            if roll:
+                photos.append((os.path.join(self.photos_dir, filename), roll))
+        return photos
+
+    def _load_cache(self):
+        """{content digest: (status, encoding)} from earlier runs"""
+        try:
+            with open(self.cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return {}
+
+    def _load_gallery(self):
+        try:
+            with open(self.encodings_file, 'rb') as f:
+                data = pickle.load(f)
+            return list(data["encodings"]), list(data["names"])
+        except FileNotFoundError:
+            return [], []
+
+    def run(self):
+        """Encode new photos, publish a new gallery version and return a summary"""
+        with self.run_lock:
+            start = time.time()
+            photos, unknown_rolls = [], []
+            for path, roll in self.scan():
+                if self.store.resolver.resolve(roll) is None:
+                    unknown_rolls.append({'photo': os.path.basename(path), 'roll': roll, 'reason': 'unknown roll number'})
+                else:
+                    photos.append((path, roll))
+            digests = [file_digest(path) for path, _ in photos]
+            cache = self._load_cache()
+
+            pending = sorted({digest: path for (path, _), digest in zip(photos, digests) if digest not in cache}.items())
+            if pending:
+                workers = min(self.workers, len(pending))
+                logger.info(f"Encoding {len(pending)} new photos with {workers} workers")
+                paths = [path for _, path in pending]
+                if workers > 1:
+                    with make_executor(workers) as executor:
+                        results = list(executor.map(_encode_photo, paths))
+                else:
+                    results = [_encode_photo(path) for path in paths]
+                for (digest, _), result in zip(pending, results):
+                    cache[digest] = result
+                _write_pickle_atomic(self.cache_file, cache)
+
+            photo_rolls = {roll for _, roll in photos}
+            encodings, names = [], []
+            # Students without photos here keep whatever they were enrolled with before
+            for encoding, name in zip(*self._load_gallery()):
+                if name not in photo_rolls:
+                    encodings.append(np.asarray(encoding, dtype=np.float32))
+                    names.append(name)
+
+            failed, warnings = [], []
+            for (path, roll), digest in zip(photos, digests):
+                status, encoding = cache[digest]
+                if encoding is None:
+                    failed.append({'photo': os.path.basename(path), 'roll': roll, 'reason': status})
+                    continue
+                if status != 'ok':
+                    warnings.append({'photo': os.path.basename(path), 'roll': roll, 'reason': status})
+                encodings.append(encoding)
+                names.append(roll)
+
+            # The gallery watcher must not rebuild from the new pickle before it is published here
+            with self.store.build_lock:
+                _write_pickle_atomic(self.encodings_file, {"encodings": encodings, "names": names})
+                version = self.store.build(encodings, names, source_mtime=os.path.getmtime(self.encodings_file))
+
+            summary = {
+                'version': version,
+                'photos': len(photos),
+                'encoded': len(pending),
+                'reused': len(photos) - len(pending),
+                'failed': failed,
+                'warnings': warnings,
+                'unknown_rolls': unknown_rolls,
+                'students': len(set(names)),
+                'rows': len(names),
+                'seconds': round(time.time() - start, 2)
+            }
+            logger.info(f"Published gallery version {version}: {summary['students']} students, "
+                        f"{summary['encoded']} photos encoded, {summary['reused']} reused")
+            return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enroll student photos into the face gallery")
+    parser.add_argument('--photos', default=PHOTOS_DIR, help="Directory of photos named <roll>[_n].jpg")
+    parser.add_argument('--workers', type=int, default=None, help="Encoding processes (default: every CPU)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    enroller = Enroller(EncodingStore(ENCODINGS_STORE_DIR, SECTIONS), photos_dir=args.photos, workers=args.workers)
+    summary = enroller.run()
+
+    print(f"Gallery version {summary['version']}: {summary['students']} students ({summary['rows']} rows)")
+    print(f"Photos: {summary['photos']} scanned, {summary['encoded']} encoded, {summary['reused']} unchanged "
+          f"in {summary['seconds']}s")
+    for failure in summary['failed'] + summary['warnings'] + summary['unknown_rolls']:
+        print(f"  ⚠️ {failure['photo']} ({failure['roll']}): {failure['reason']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Face Matcher - Vectorized gallery matching for face recognition
+Keeps a section's known encodings in one contiguous float32 matrix and
+scores every face of a frame against it in a single batched computation
+"""
+
+import numpy as np
+
+# Length of a face_recognition (dlib) face encoding
+ENCODING_DIM = 128
+
+
+def pairwise_sq_distances(queries, points, point_sq_norms):
+    """Squared euclidean distances between every query and point row, clamped at zero"""
+    # ||q - p||^2 = ||q||^2 + ||p||^2 - 2 q.p for all pairs at once
+    sq_distances = queries @ points.T
+    sq_distances *= -2.0
+    sq_distances += np.einsum('ij,ij->i', queries, queries)[:, None]
+    sq_distances += point_sq_norms[None, :]
+    np.maximum(sq_distances, 0.0, out=sq_distances)
+    return sq_distances
+
+
+class FaceMatcher:
+    """Nearest-neighbour matcher over a fixed gallery of face encodings"""
+
+    def __init__(self, known_encodings, known_names, tolerance=0.41, index_mode='exact', nprobe=4):
+        self.names = list(known_names)
+        self.tolerance = tolerance
+
+        # One contiguous (n_faces, 128) matrix with precomputed squared norms
+        encodings = np.asarray(known_encodings, dtype=np.float32).reshape(len(self.names), ENCODING_DIM)
+        self.encodings = np.ascontiguousarray(encodings)
+        self.sq_norms = np.einsum('ij,ij->i', self.encodings, self.encodings)
+
+        # Optional approximate index for campus-scale galleries
+        self.index = None
+        if index_mode == 'ivf':
+            from ann_index import IVFIndex
+            self.index = IVFIndex(self.encodings, nprobe=nprobe)
+
+    def __len__(self):
+        return len(self.names)
+
+    def match(self, face_encodings):
+        """Return (best_indices, best_distances) arrays, one entry per face encoding"""
+        if len(face_encodings) == 0 or len(self.names) == 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        queries = np.asarray(face_encodings, dtype=np.float32).reshape(len(face_encodings), ENCODING_DIM)
+        if self.index is not None:
+            return self.index.search(queries)
+
+        sq_distances = pairwise_sq_distances(queries, self.encodings, self.sq_norms)
+        best_indices = np.argmin(sq_distances, axis=1)
+        best_distances = np.sqrt(sq_distances[np.arange(len(queries)), best_indices])
+        return best_indices, best_distances
+
+    def nearest(self, face_encodings):
+        """Return the closest gallery (name, distance) per face encoding, however far away"""
+        if len(self.names) == 0:
+            return [("Unknown", float('inf'))] * len(face_encodings)
+
+        best_indices, best_distances = self.match(face_encodings)
+        return [(self.names[index], float(distance)) for index, distance in zip(best_indices, best_distances)]
+
+    def accept(self, candidates):
+        """Turn nearest() candidates into (name, confidence) pairs, "Unknown" beyond tolerance"""
+        return [(name, 1 - distance) if distance < self.tolerance else ("Unknown", 0)
+                for name, distance in candidates]
+
+    def identify(self, face_encodings):
+        """Return a (name, confidence) pair per face encoding, "Unknown" beyond tolerance"""
+        return self.accept(self.nearest(face_encodings))
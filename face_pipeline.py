@@ -0,0 +1,155 @@
+"""
+Face Pipeline - Detection, encoding and matching for a single frame
+Shared by the in-thread CameraProcessor path and the recognition worker processes
+"""
+
+import cv2
+import face_recognition
+
+from face_quality import estimate_yaw, face_size, laplacian_sharpness
+from pipeline_metrics import stage_timer
+
+
+def detect_faces(rgb_frame):
+    """HOG face detection, returns (top, right, bottom, left) boxes"""
+    return face_recognition.face_locations(rgb_frame, model="hog")
+
+
+def encode_faces(rgb_frame, face_locations):
+    """128-d encodings for the given face boxes"""
+    if not face_locations:
+        return []
+    return face_recognition.face_encodings(rgb_frame, face_locations)
+
+
+def check_face_quality(rgb_frame, face_locations, min_face_size=40, min_sharpness=30.0, max_yaw=0.3,
+                       size_scale=1.0):
+    """Skip reason per face box ('small', 'blurry', 'pose') or None when it is worth encoding
+
+    `min_face_size` is in full-frame pixels; `size_scale` converts box sizes
+    in `rgb_frame` to full-frame pixels. Landmarks are only located for faces
+    that passed the size and sharpness checks.
+    """
+    reasons = []
+    for face_location in face_locations:
+        if face_size(face_location) * size_scale < min_face_size:
+            reasons.append('small')
+        elif laplacian_sharpness(rgb_frame, face_location) < min_sharpness:
+            reasons.append('blurry')
+        else:
+            reasons.append(None)
+
+    candidates = [i for i, reason in enumerate(reasons) if reason is None]
+    if candidates and max_yaw is not None:
+        landmarks = face_recognition.face_landmarks(rgb_frame, [face_locations[i] for i in candidates], model="small")
+        for i, face_landmarks in zip(candidates, landmarks):
+            if estimate_yaw(face_landmarks) > max_yaw:
+                reasons[i] = 'pose'
+    return reasons
+
+
+def scale_box(face_location, factor):
+    """Scale a (top, right, bottom, left) box between frame resolutions"""
+    return tuple(int(round(coord * factor)) for coord in face_location)
+
+
+def recognize_frame(frame, matcher, detect_scale=0.5, encode_full_resolution=True, quality=None, tracker=None,
+                    metrics=None):
+    """Detect, encode and identify every face in a full-resolution BGR frame
+
+    HOG detection runs on the frame shrunk by `detect_scale`. With
+    `encode_full_resolution` the boxes are mapped back and encodings are
+    computed on the full frame, which gives cleaner distances than encoding
+    the shrunk faces. Returned boxes are in full-frame coordinates. With a
+    tracker, faces on already identified tracks reuse their label and only
+    new, lost or low-confidence tracks are encoded. With `quality`
+    (check_face_quality thresholds) faces failing the quality gate are not
+    encoded and come back as Unknown with a `skipped` reason. Faces encoded
+    in this frame also carry their `nearest` gallery name and its `distance`,
+    even beyond tolerance, so sessions can be replayed under other
+    thresholds. Stage timings and skip counters go to `metrics` when given.
+    """
+    with stage_timer(metrics, 'resize'):
+        small_frame = cv2.resize(frame, (0, 0), fx=detect_scale, fy=detect_scale) if detect_scale != 1 else frame
+    with stage_timer(metrics, 'convert'):
+        rgb_small_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+    with stage_timer(metrics, 'detect'):
+        face_locations = [scale_box(location, 1 / detect_scale) for location in detect_faces(rgb_small_frame)]
+
+    def identify(locations):
+        """(identities, details) for full-frame boxes; only faces passing the quality gate are encoded
+
+        Details are {'skipped': reason} or the {'nearest', 'distance'} match of each face.
+        """
+        if not locations:
+            return [], []
+        if encode_full_resolution:
+            # Only frames with faces to encode pay for the full-resolution conversion
+            rgb_frame, boxes, size_scale = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), locations, 1.0
+        else:
+            rgb_frame, size_scale = rgb_small_frame, 1 / detect_scale
+            boxes = [scale_box(location, detect_scale) for location in locations]
+
+        reasons = [None] * len(boxes)
+        if quality is not None:
+            with stage_timer(metrics, 'quality'):
+                reasons = check_face_quality(rgb_frame, boxes, size_scale=size_scale, **quality)
+            if metrics is not None:
+                for reason in filter(None, reasons):
+                    metrics.increment(f'faces_skipped_{reason}')
+
+        with stage_timer(metrics, 'encode'):
+            face_encodings = encode_faces(rgb_frame, [box for box, reason in zip(boxes, reasons) if reason is None])
+        if metrics is not None:
+            metrics.increment('faces_encoded', len(face_encodings))
+        # Score every encoded face in the frame against the gallery in one batch
+        with stage_timer(metrics, 'match'):
+            candidates = matcher.nearest(face_encodings)
+            matched = iter(zip(matcher.accept(candidates), candidates))
+
+        identities, details = [], []
+        for reason in reasons:
+            if reason:
+                identities.append(("Unknown", 0))
+                details.append({'skipped': reason})
+            else:
+                identity, (nearest, distance) = next(matched)
+                identities.append(identity)
+                details.append({'nearest': nearest, 'distance': distance})
+        return identities, details
+
+    if tracker is None:
+        identities, details = identify(face_locations)
+        track_states = [{}] * len(face_locations)
+    else:
+        with stage_timer(metrics, 'track'):
+            tracks = tracker.update(face_locations)
+        pending = [track for track in tracks if track.needs_encoding]
+        pending_identities, pending_details = identify([track.location for track in pending])
+        details = {}
+        for track, identity, detail in zip(pending, pending_identities, pending_details):
+            details[track.track_id] = detail
+            # A skipped face keeps whatever its track was known as and is retried on the next frame
+            if 'skipped' not in detail:
+                track.assign_identity(*identity)
+        if metrics is not None:
+            metrics.increment('faces_reused', len(tracks) - len(pending))
+        identities = [(track.name, track.confidence) for track in tracks]
+        track_states = [track.to_dict() for track in tracks]
+        details = [details.get(track.track_id, {}) for track in tracks]
+
+    if metrics is not None:
+        metrics.increment('faces_detected', len(face_locations))
+
+    recognized_faces = []
+    for (name, confidence), face_location, track_state, detail in zip(identities, face_locations, track_states,
+                                                                      details):
+        recognized_faces.append({
+            'name': name,
+            'confidence': confidence,
+            'location': face_location,
+            **track_state,
+            **detail
+        })
+
+    return recognized_faces
@@ -0,0 +1,49 @@
+"""
+Face Quality - Cheap scores that decide whether a detected face is worth encoding
+Box size, Laplacian sharpness and a landmark-based yaw estimate, checked
+cheapest first so tiny, blurred or turned-away faces never reach the 128-d
+encoder they would not match with anyway.
+"""
+
+import cv2
+import numpy as np
+
+# Crops are resampled to this edge before measuring sharpness, so the score
+# does not depend on how large the face is in the frame
+SHARPNESS_SIZE = 64
+
+
+def face_size(face_location):
+    """Shorter edge of a (top, right, bottom, left) box in pixels"""
+    top, right, bottom, left = face_location
+    return min(bottom - top, right - left)
+
+
+def laplacian_sharpness(rgb_frame, face_location):
+    """Variance of the Laplacian over the face crop; low values mean blur"""
+    height, width = rgb_frame.shape[:2]
+    top, right, bottom, left = face_location
+    crop = rgb_frame[max(top, 0):min(bottom, height), max(left, 0):min(right, width)]
+    if crop.size == 0:
+        return 0.0
+    gray = cv2.cvtColor(crop, cv2.COLOR_RGB2GRAY)
+    gray = cv2.resize(gray, (SHARPNESS_SIZE, SHARPNESS_SIZE), interpolation=cv2.INTER_AREA)
+    return float(cv2.Laplacian(gray, cv2.CV_32F).var())
+
+
+def estimate_yaw(landmarks):
+    """Nose-tip offset from the eye midpoint along the eye line, in eye distances
+
+    Takes face_recognition's 5-point landmarks. About 0 for a frontal face,
+    growing towards 0.5 and beyond as the head turns to profile; independent
+    of in-plane rotation, which the encoder aligns away anyway.
+    """
+    left_eye = np.mean(landmarks['left_eye'], axis=0)
+    right_eye = np.mean(landmarks['right_eye'], axis=0)
+    nose = np.mean(landmarks['nose_tip'], axis=0)
+
+    eye_axis = right_eye - left_eye
+    eye_distance_sq = float(np.dot(eye_axis, eye_axis))
+    if eye_distance_sq == 0:
+        return float('inf')
+    return abs(float(np.dot(nose - (left_eye + right_eye) / 2, eye_axis))) / eye_distance_sq
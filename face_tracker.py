@@ -0,0 +1,120 @@
+"""
+Face Tracker - IoU/centroid tracking between detection and encoding
+Keeps identities attached to face boxes across frames so that encodings are
+only recomputed for new, lost or low-confidence tracks.
+"""
+
+import itertools
+
+
+def box_iou(box_a, box_b):
+    """Intersection over union of two (top, right, bottom, left) boxes"""
+    top = max(box_a[0], box_b[0])
+    right = min(box_a[1], box_b[1])
+    bottom = min(box_a[2], box_b[2])
+    left = max(box_a[3], box_b[3])
+
+    intersection = max(0, right - left) * max(0, bottom - top)
+    if intersection == 0:
+        return 0.0
+
+    area_a = (box_a[1] - box_a[3]) * (box_a[2] - box_a[0])
+    area_b = (box_b[1] - box_b[3]) * (box_b[2] - box_b[0])
+    return intersection / float(area_a + area_b - intersection)
+
+
+def _centroid_close(box_a, box_b):
+    """True when the box centres are within half a box width of each other"""
+    centre_a = ((box_a[0] + box_a[2]) / 2, (box_a[1] + box_a[3]) / 2)
+    centre_b = ((box_b[0] + box_b[2]) / 2, (box_b[1] + box_b[3]) / 2)
+    width = max(box_a[1] - box_a[3], box_b[1] - box_b[3])
+    return abs(centre_a[0] - centre_b[0]) <= width / 2 and abs(centre_a[1] - centre_b[1]) <= width / 2
+
+
+class FaceTrack:
+    """One tracked face and the identity last assigned to it"""
+
+    def __init__(self, track_id, location):
+        self.track_id = track_id
+        self.location = location
+        self.name = "Unknown"
+        self.confidence = 0
+        self.hits = 1
+        self.missed = 0
+        self.frames_since_encoding = 0
+        self.needs_encoding = True
+
+    def assign_identity(self, name, confidence):
+        self.name = name
+        self.confidence = confidence
+        self.frames_since_encoding = 0
+
+    def to_dict(self):
+        return {
+            'track_id': self.track_id,
+            'hits': self.hits,
+            'reused': not self.needs_encoding
+        }
+
+
+class FaceTracker:
+    """Greedy IoU tracker with a centroid fallback for fast head movement"""
+
+    def __init__(self, iou_threshold=0.3, max_missed=5, min_confidence=0.5, refresh_frames=30, settled=None):
+        self.iou_threshold = iou_threshold
+        self.max_missed = max_missed          # Frames a track survives without a detection
+        self.min_confidence = min_confidence  # Identified tracks below this are re-encoded
+        self.refresh_frames = refresh_frames  # Re-encode confirmed tracks this often anyway
+        # settled(name) -> bool; tracks of unsettled students are re-encoded every frame, e.g. until
+        # enough fresh encodings have voted them present
+        self.settled = settled
+        self.tracks = []
+        self._ids = itertools.count(1)
+
+    def update(self, face_locations):
+        """Associate this frame's detections with tracks, returns one track per detection"""
+        pairs = []
+        for t, track in enumerate(self.tracks):
+            for d, location in enumerate(face_locations):
+                iou = box_iou(track.location, location)
+                if iou >= self.iou_threshold or _centroid_close(track.location, location):
+                    pairs.append((iou, t, d))
+        pairs.sort(reverse=True)
+
+        matched_tracks = set()
+        assigned = [None] * len(face_locations)
+        for _, t, d in pairs:
+            if t in matched_tracks or assigned[d] is not None:
+                continue
+            track = self.tracks[t]
+            was_lost = track.missed > 0
+
+            track.location = face_locations[d]
+            track.hits += 1
+            track.missed = 0
+            track.frames_since_encoding += 1
+            track.needs_encoding = (
+                was_lost
+                or track.name == "Unknown"
+                or track.confidence < self.min_confidence
+                or track.frames_since_encoding >= self.refresh_frames
+                or (self.settled is not None and not self.settled(track.name))
+            )
+
+            matched_tracks.add(t)
+            assigned[d] = track
+
+        surviving = []
+        for t, track in enumerate(self.tracks):
+            if t not in matched_tracks:
+                track.missed += 1
+            if track.missed <= self.max_missed:
+                surviving.append(track)
+
+        for d, location in enumerate(face_locations):
+            if assigned[d] is None:
+                assigned[d] = FaceTrack(next(self._ids), location)
+                surviving.append(assigned[d])
+
+        self.tracks = surviving
+        return assigned
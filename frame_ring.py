@@ -0,0 +1,55 @@
+"""
+Frame Ring - Preallocated ring buffer of captured frames
+The decoder writes each frame in place into the next slot and publishes it
+with a sequence number; readers borrow read-only views by sequence number
+instead of copying. A borrowed view stays valid until the writer wraps around
+to its slot, which readers check with is_valid().
+"""
+
+import numpy as np
+
+
+class FrameRing:
+    """Single-writer, many-reader ring of equally shaped frames"""
+
+    def __init__(self, shape, slots=8, dtype=np.uint8, start_seq=0):
+        self.shape = tuple(shape)
+        self.slots = slots
+        self.buffer = np.empty((slots,) + self.shape, dtype=dtype)
+        self.latest_seq = start_seq  # Sequence number of the newest published frame
+
+    def next_slot(self):
+        """Writable slot for the frame after latest_seq; publish() makes it visible"""
+        return self.buffer[(self.latest_seq + 1) % self.slots]
+
+    def publish(self):
+        self.latest_seq += 1
+        return self.latest_seq
+
+    def write(self, frame):
+        """Copy a frame that was decoded elsewhere into the next slot"""
+        np.copyto(self.next_slot(), frame)
+        return self.publish()
+
+    def is_valid(self, seq):
+        """True while seq is published and its slot is not the one being rewritten"""
+        return 0 < seq <= self.latest_seq and self.latest_seq - seq <= self.slots - 2
+
+    def borrow(self, seq=None):
+        """Read-only view of frame `seq` (default newest), or None once it was overwritten"""
+        seq = self.latest_seq if seq is None else seq
+        if not self.is_valid(seq):
+            return None
+        view = self.buffer[seq % self.slots]
+        view.flags.writeable = False
+        return view
+
+    def copy_latest(self, out):
+        """Copy the newest frame into `out`, retrying if the writer lapped the copy; returns its seq"""
+        while True:
+            seq = self.latest_seq
+            if seq == 0:
+                return 0
+            np.copyto(out, self.buffer[seq % self.slots])
+            if self.is_valid(seq):
+                return seq
@@ -0,0 +1,69 @@
+"""
+Frame Scheduler - Motion-gated recognition rate for the capture loop
+Scores scene activity with a cheap downsampled frame difference and spaces
+recognition frames between a trickle (static lecture) and a burst (students
+walking in).
+"""
+
+import time
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+class MotionScheduler:
+    """Chooses which captured frames are sent to recognition"""
+
+    def __init__(self, min_rate=0.5, max_rate=10.0, full_activity=0.04, probe_size=(64, 48), smoothing=0.3):
+        self.min_rate = min_rate            # Recognition frames/sec for a static scene
+        self.max_rate = max_rate            # Recognition frames/sec at full activity
+        self.full_activity = full_activity  # Mean absolute difference (0..1) treated as full activity
+        self.probe_size = probe_size
+        self.smoothing = smoothing
+
+        self.motion_score = 1.0  # Start in burst mode so the first faces are picked up quickly
+        # Probe buffers are reused so scoring a frame allocates nothing
+        width, height = probe_size
+        self._probe_bgr = np.empty((height, width, 3), dtype=np.uint8)
+        self._probe = np.empty((height, width), dtype=np.uint8)
+        self._previous_probe = np.empty((height, width), dtype=np.uint8)
+        self._difference = np.empty((height, width), dtype=np.uint8)
+        self._has_previous = False
+        self._last_dispatch = 0.0
+        self._dispatch_times = deque()
+
+    def _update_motion(self, frame):
+        cv2.resize(frame, self.probe_size, dst=self._probe_bgr, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._probe_bgr, cv2.COLOR_BGR2GRAY, dst=self._probe)
+
+        if self._has_previous:
+            cv2.absdiff(self._probe, self._previous_probe, dst=self._difference)
+            difference = cv2.mean(self._difference)[0] / 255.0
+            activity = min(difference / self.full_activity, 1.0)
+            self.motion_score += self.smoothing * (activity - self.motion_score)
+        self._probe, self._previous_probe = self._previous_probe, self._probe
+        self._has_previous = True
+
+    @property
+    def target_rate(self):
+        return self.min_rate + (self.max_rate - self.min_rate) * self.motion_score
+
+    def should_recognize(self, frame, now=None):
+        """Update the motion score with this frame and report whether recognition is due"""
+        now = time.time() if now is None else now
+        self._update_motion(frame)
+        return now - self._last_dispatch >= 1.0 / self.target_rate
+
+    def mark_dispatched(self, now=None):
+        """Record that a frame was actually handed to recognition"""
+        now = time.time() if now is None else now
+        self._last_dispatch = now
+        self._dispatch_times.append(now)
+
+    def effective_rate(self, window=5.0, now=None):
+        """Recognition frames per second actually dispatched over the last `window` seconds"""
+        now = time.time() if now is None else now
+        while self._dispatch_times and now - self._dispatch_times[0] > window:
+            self._dispatch_times.popleft()
+        return len(self._dispatch_times) / window
@@ -0,0 +1,330 @@
+"""
+Frame Sources - Pluggable camera inputs for CameraProcessor
+Local devices, RTSP/HTTP streams, video files and image directories, each
+decoded on its own thread. Live sources keep only the newest frame and
+reconnect with exponential backoff; file sources can deliver every frame in
+order so recorded lectures replay deterministically. Frames are decoded in
+place into a FrameRing and handed out as read-only views, so steady-state
+capture allocates no frame memory.
+"""
+
+import glob
+import logging
+import os
+import threading
+import time
+
+import cv2
+
+from frame_ring import FrameRing
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+class FrameSource:
+    """Base class: runs the decoder on a background thread"""
+
+    def __init__(self, drop_stale=True, reconnect=False, initial_backoff=0.5, max_backoff=30.0, ring_slots=8):
+        self.drop_stale = drop_stale  # Live sources: readers only ever get the newest frame
+        self.ring_slots = ring_slots
+        self.reconnect = reconnect
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.is_running = False
+        self.finished = False  # Set when a file source runs out of frames
+        self.frames_decoded = 0
+        self.frames_dropped = 0
+        self.reconnects = 0
+
+        self.ring = None  # Created from the first frame's shape
+        self.frame_seq = 0  # Ring sequence number of the frame last returned by read()
+
+        self._thread = None
+        self._condition = threading.Condition()
+
+    # ----- subclass hooks -----
+
+    def describe(self):
+        return self.__class__.__name__
+
+    def _open(self):
+        """Open the underlying capture, return True on success"""
+        raise NotImplementedError
+
+    def _read_frame(self, out=None):
+        """Return (ret, frame) for the next frame, decoding into `out` when possible"""
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+    # ----- public API -----
+
+    def start(self):
+        """Open the source and start decoding, returns (success, message)"""
+        try:
+            if not self._open():
+                return False, f"Cannot open frame source {self.describe()}"
+        except Exception as e:
+            logger.error(f"Frame source error: {e}")
+            return False, f"Cannot open frame source {self.describe()}: {e}"
+
+        self.is_running = True
+        self._thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self._thread.start()
+        return True, f"Frame source {self.describe()} opened"
+
+    def _has_unread(self):
+        return self.ring is not None and self.ring.latest_seq > self.frame_seq
+
+    def read(self, timeout=1.0):
+        """Return (ret, frame); waits up to `timeout` for a frame not read before
+
+        The frame is a read-only view into `ring` at sequence `frame_seq`.
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._has_unread() or self.finished, timeout):
+                return False, None
+            if not self._has_unread():
+                return False, None
+
+            seq = self.ring.latest_seq if self.drop_stale else self.frame_seq + 1
+            self.frames_dropped += seq - self.frame_seq - 1
+            self.frame_seq = seq
+            # Wakes a replaying decoder waiting for a free slot
+            self._condition.notify_all()
+            return True, self.ring.borrow(seq)
+
+    def release(self):
+        self.is_running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._close()
+
+    # ----- decoder thread -----
+
+    def _slot_free(self):
+        return self.ring is None or self.drop_stale or self.ring.latest_seq - self.frame_seq < self.ring.slots - 2
+
+    def _decode_loop(self):
+        backoff = self.initial_backoff
+        while self.is_running:
+            if not self.drop_stale:
+                # Replay never overwrites a frame the reader has not taken yet
+                with self._condition:
+                    if not self._condition.wait_for(lambda: self._slot_free() or not self.is_running, 0.5):
+                        continue
+            buffer = self.ring.next_slot() if self.ring is not None else None
+            ret, frame = self._read_frame(buffer)
+            if not ret:
+                if self.finished or not self.reconnect:
+                    # The stream has ended for good, so the source no longer counts as running
+                    self.finished = True
+                    self.is_running = False
+                    with self._condition:
+                        self._condition.notify_all()
+                    break
+                logger.warning(f"Lost frame source {self.describe()}, reconnecting in {backoff:.1f}s")
+                self._close()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                self.reconnects += 1
+                try:
+                    self._open()
+                except Exception as e:
+                    logger.error(f"Reconnect to {self.describe()} failed: {e}")
+                continue
+
+            backoff = self.initial_backoff
+            self.frames_decoded += 1
+            with self._condition:
+                if self.ring is None or self.ring.shape != frame.shape:
+                    # First frame or a resolution change; old views stay valid in the old ring
+                    start_seq = self.ring.latest_seq if self.ring is not None else 0
+                    self.ring = FrameRing(frame.shape, self.ring_slots, frame.dtype, start_seq)
+                    self.ring.write(frame)
+                elif frame is buffer:
+                    self.ring.publish()
+                else:
+                    self.ring.write(frame)
+                self._condition.notify_all()
+
+
+class DeviceSource(FrameSource):
+    """Local camera by index; probes indices 0-3 when none is given"""
+
+    def __init__(self, index=None, width=640, height=480, fps=15):
+        super().__init__(drop_stale=True, reconnect=True)
+        self.index = index
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.capture = None
+
+    def describe(self):
+        return f"camera {self.index if self.index is not None else '(auto)'}"
+
+    def _open(self):
+        # DirectShow is only available on Windows
+        backend = cv2.CAP_DSHOW if os.name == 'nt' else cv2.CAP_ANY
+        indices = [self.index] if self.index is not None else range(0, 4)
+        for i in indices:
+            capture = cv2.VideoCapture(i, backend)
+            if capture.isOpened():
+                ret, _ = capture.read()
+                if ret:
+                    logger.info(f"Camera found at index {i}")
+                    self.index = i
+                    self.capture = capture
+                    break
+            capture.release()
+        else:
+            return False
+
+        # Optimize camera settings for performance
+        self.capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self.capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        self.capture.set(cv2.CAP_PROP_FPS, self.fps)
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        self.capture.set(cv2.CAP_PROP_AUTOFOCUS, 0)
+        self.capture.set(cv2.CAP_PROP_AUTO_EXPOSURE, 1)
+        return True
+
+    def _read_frame(self, out=None):
+        if self.capture is None:
+            return False, None
+        # Decodes straight into the ring slot when the shape matches
+        return self.capture.read(out) if out is not None else self.capture.read()
+
+    def _close(self):
+        if self.capture is not None:
+            self.capture.release()
+            self.capture = None
+
+
+class StreamSource(DeviceSource):
+    """RTSP or HTTP(S) network camera"""
+
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+
+    def describe(self):
+        # Never log stream credentials
+        return self.url.split('@')[-1]
+
+    def _open(self):
+        self.capture = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
+        if not self.capture.isOpened():
+            self.capture.release()
+            self.capture = None
+            return False
+        self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return True
+
+
+class VideoFileSource(DeviceSource):
+    """Recorded lecture; every frame is delivered in order unless realtime pacing is asked for"""
+
+    def __init__(self, path, realtime=False, loop=False):
+        FrameSource.__init__(self, drop_stale=realtime, reconnect=False)
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.capture = None
+        self._frame_interval = 0
+        self._next_frame_time = 0
+
+    def describe(self):
+        return self.path
+
+    def _open(self):
+        self.capture = cv2.VideoCapture(self.path)
+        if not self.capture.isOpened():
+            return False
+        file_fps = self.capture.get(cv2.CAP_PROP_FPS) or 25
+        self._frame_interval = 1.0 / file_fps
+        self._next_frame_time = time.time()
+        return True
+
+    def _read_frame(self, out=None):
+        ret, frame = DeviceSource._read_frame(self, out)
+        if not ret and self.loop:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = DeviceSource._read_frame(self, out)
+        if not ret:
+            self.finished = True
+            return False, None
+
+        if self.realtime:
+            # Pace decoding at the recording's own frame rate
+            delay = self._next_frame_time - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            self._next_frame_time = max(self._next_frame_time, time.time() - 1.0) + self._frame_interval
+        return True, frame
+
+
+class ImageDirectorySource(FrameSource):
+    """Sorted still images played back as a frame sequence"""
+
+    def __init__(self, path, fps=None, loop=False):
+        super().__init__(drop_stale=fps is not None, reconnect=False)
+        self.path = path
+        self.fps = fps  # None delivers every image as fast as it is read
+        self.loop = loop
+        self.files = []
+        self.position = 0
+
+    def describe(self):
+        return self.path
+
+    def _open(self):
+        self.files = sorted(f for f in glob.glob(os.path.join(self.path, '*'))
+                            if f.lower().endswith(IMAGE_EXTENSIONS))
+        self.position = 0
+        return bool(self.files)
+
+    def _read_frame(self, out=None):
+        frame = None
+        skipped = 0
+        while frame is None:
+            # A looping pass over nothing but unreadable images would never end
+            if skipped >= len(self.files):
+                logger.error(f"No readable images left in {self.path}")
+                self.finished = True
+                return False, None
+            if self.position >= len(self.files):
+                if not self.loop:
+                    self.finished = True
+                    return False, None
+                self.position = 0
+
+            path = self.files[self.position]
+            self.position += 1
+            frame = cv2.imread(path)
+            if frame is None:
+                skipped += 1
+                logger.warning(f"Skipping unreadable image {path}")
+
+        if self.fps:
+            time.sleep(1.0 / self.fps)
+        return True, frame
+
+
+def open_frame_source(source=None):
+    """Build a frame source from a camera index, URL, video file or image directory"""
+    if source is None:
+        return DeviceSource()
+    if isinstance(source, int) or str(source).isdigit():
+        return DeviceSource(int(source))
+
+    source = str(source)
+    if source.lower().startswith(('rtsp://', 'rtsps://', 'http://', 'https://')):
+        return StreamSource(source)
+    if os.path.isdir(source):
+        return ImageDirectorySource(source)
+    return VideoFileSource(source)
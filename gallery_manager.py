@@ -0,0 +1,114 @@
+"""
+Gallery Manager - Hot reload of the face gallery
+Watches the EncodingStore for newly published versions (and rebuilds it when
+encodings.pkl changes underneath it), then swaps fresh section matchers into
+new and running attendance sessions without restarting the server.
+"""
+
+import logging
+import os
+import threading
+import weakref
+from datetime import datetime
+
+from face_matcher import FaceMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class GalleryManager:
+    """Serves section matchers for the live gallery version and hot-swaps them"""
+
+    def __init__(self, store, source_file, matcher_options=None, poll_interval=5.0):
+        self.store = store
+        self.source_file = source_file  # Legacy encodings.pkl the store is rebuilt from when it changes
+        self.matcher_options = matcher_options or {}
+        self.poll_interval = poll_interval
+
+        self.version = 0
+        self.loaded_at = None
+        self._matchers = {}  # section_id -> FaceMatcher for self.version
+        self._subscribers = {}  # section_id -> WeakSet of objects with swap_matcher(matcher, version)
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background watcher (idempotent)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._watch, daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check_for_updates()
+            except Exception as e:
+                logger.error(f"Gallery reload error: {e}")
+
+    def check_for_updates(self):
+        """Rebuild from encodings.pkl if it changed and load any newer store version; True if swapped"""
+        if os.path.exists(self.source_file) and self.store.is_stale(self.source_file):
+            # Re-checked under the build lock: an enrollment may be publishing this very pickle
+            if self.store.rebuild_if_stale(self.source_file):
+                logger.info("Rebuilt face gallery store from encodings.pkl")
+
+        version = self.store.current_version()
+        with self._lock:
+            if version == self.version:
+                return False
+            previous = self.version
+            self.version = version
+            self.loaded_at = datetime.now().isoformat()
+            self._matchers = {}
+            swaps = [(section_id, list(subscribers)) for section_id, subscribers in self._subscribers.items()]
+
+        for section_id, subscribers in swaps:
+            if not subscribers:
+                continue
+            matcher = self.matcher_for(section_id)
+            for subscriber in subscribers:
+                subscriber.swap_matcher(matcher, version)
+        if previous:
+            logger.info(f"Face gallery version {previous} -> {version} swapped into running sessions")
+        return True
+
+    def matcher_for(self, section_id):
+        """FaceMatcher over the section's slice of the current gallery version"""
+        if not self.version:
+            self.check_for_updates()
+        with self._lock:
+            matcher = self._matchers.get(section_id)
+            if matcher is None:
+                encodings, names = self.store.load_section(section_id)
+                matcher = FaceMatcher(encodings, names, **self.matcher_options)
+                self._matchers[section_id] = matcher
+            return matcher
+
+    def register(self, section_id, subscriber):
+        """Have `subscriber.swap_matcher(matcher, version)` called on every new version"""
+        with self._lock:
+            self._subscribers.setdefault(section_id, weakref.WeakSet()).add(subscriber)
+
+    def unregister(self, section_id, subscriber):
+        with self._lock:
+            self._subscribers.get(section_id, weakref.WeakSet()).discard(subscriber)
+
+    def status(self):
+        metadata = self.store.metadata() or {}
+        sections = {section_id: end - start for section_id, (start, end) in metadata.get('sections', {}).items()}
+        with self._lock:
+            subscribed = sum(len(subscribers) for subscribers in self._subscribers.values())
+        return {
+            'version': self.version,
+            'published_version': self.store.current_version(),
+            'loaded_at': self.loaded_at,
+            'size': metadata.get('count', 0),
+            'sections': sections,
+            'running_sessions': subscribed
+        }
+
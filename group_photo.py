@@ -0,0 +1,100 @@
+"""
+Group Photo - Batch attendance from high-resolution class photos
+Large photos are split into overlapping full-resolution tiles so that small
+faces at the back of the hall stay above the HOG detector's minimum size.
+Tiles are detected in parallel worker processes, duplicate boxes along tile
+borders are merged, and the surviving faces are encoded and matched in one batch.
+"""
+
+import logging
+import os
+
+import cv2
+
+from face_pipeline import detect_faces, encode_faces
+from face_tracker import box_iou
+from recognition_pool import make_executor
+
+logger = logging.getLogger(__name__)
+
+
+def tile_boxes(height, width, tile_size=1280, overlap=320):
+    """Overlapping (top, left, bottom, right) tiles that cover the whole image"""
+    def starts(length):
+        if length <= tile_size:
+            return [0]
+        stride = tile_size - overlap
+        positions = list(range(0, length - tile_size, stride))
+        positions.append(length - tile_size)  # Last tile flush with the edge
+        return positions
+
+    return [(top, left, min(top + tile_size, height), min(left + tile_size, width))
+            for top in starts(height) for left in starts(width)]
+
+
+def merge_detections(face_locations, iou_threshold=0.3, containment=0.6):
+    """Drop duplicate boxes, keeping the largest box of each face
+
+    A face cut by a tile border yields a partial box mostly inside the box
+    found in the neighbouring tile, so containment is checked as well as IoU.
+    """
+    def area(box):
+        return max(0, box[1] - box[3]) * max(0, box[2] - box[0])
+
+    merged = []
+    for box in sorted(face_locations, key=area, reverse=True):
+        duplicate = False
+        for kept in merged:
+            intersection = (max(0, min(box[1], kept[1]) - max(box[3], kept[3]))
+                            * max(0, min(box[2], kept[2]) - max(box[0], kept[0])))
+            if box_iou(box, kept) >= iou_threshold or intersection >= containment * max(area(box), 1):
+                duplicate = True
+                break
+        if not duplicate:
+            merged.append(box)
+    return merged
+
+
+def _detect_tile(job):
+    """Detect faces in one tile and shift the boxes into image coordinates"""
+    tile, top, left, scale = job
+    try:
+        return [(int(t * scale) + top, int(r * scale) + left, int(b * scale) + top, int(l * scale) + left)
+                for t, r, b, l in detect_faces(tile)]
+    except Exception as e:
+        logger.error(f"Tile detection error: {e}")
+        return []
+
+
+def detect_faces_tiled(rgb_image, tile_size=1280, overlap=320, workers=None):
+    """Detect faces over overlapping tiles plus one downscaled whole-image pass
+
+    The whole-image pass catches front-row faces larger than the tile overlap.
+    """
+    height, width = rgb_image.shape[:2]
+    jobs = [(rgb_image[top:bottom, left:right], top, left, 1)
+            for top, left, bottom, right in tile_boxes(height, width, tile_size, overlap)]
+
+    if len(jobs) > 1:
+        scale = max(height, width) / float(tile_size)
+        overview = cv2.resize(rgb_image, (int(width / scale), int(height / scale)), interpolation=cv2.INTER_AREA)
+        jobs.append((overview, 0, 0, scale))
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers > 1:
+        with make_executor(workers) as executor:
+            results = list(executor.map(_detect_tile, jobs))
+    else:
+        results = [_detect_tile(job) for job in jobs]
+
+    return merge_detections([box for boxes in results for box in boxes])
+
+
+def recognize_group_photo(image, matcher, tile_size=1280, overlap=320, workers=None):
+    """Detect, encode and identify every face in a BGR photo"""
+    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    face_locations = detect_faces_tiled(rgb_image, tile_size, overlap, workers)
+    face_encodings = encode_faces(rgb_image, face_locations)
+
+    return [{'name': name, 'confidence': confidence, 'location': face_location}
+            for (name, confidence), face_location in zip(matcher.identify(face_encodings), face_locations)]
@@ -0,0 +1,109 @@
+"""
+MJPEG Broadcaster - Encode each annotated frame once per camera session
+A single thread renders and JPEG-encodes a frame only when the camera frame or
+the recognition boxes changed, and every /video_feed client streams the same
+bytes. Clients always pick up the newest frame, so a slow viewer skips frames
+instead of holding up the projector or the other viewers.
+"""
+
+import logging
+import threading
+import time
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def multipart_chunk(jpeg_bytes):
+    """One part of a multipart/x-mixed-replace MJPEG stream"""
+    return b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + jpeg_bytes + b'\r\n\r\n'
+
+
+@lru_cache(maxsize=32)
+def placeholder_chunk(text, color=(255, 255, 255), font_scale=1, origin=(150, 240)):
+    """Rendered and encoded once per message, then served from the cache"""
+    placeholder = np.zeros((480, 640, 3), dtype=np.uint8)
+    cv2.putText(placeholder, text, origin, cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, 2)
+    ret, jpeg = cv2.imencode('.jpg', placeholder)
+    return multipart_chunk(jpeg.tobytes())
+
+
+class MJPEGBroadcaster:
+    """Shares one JPEG encode of each new frame between all subscribers"""
+
+    def __init__(self, render_frame, frame_version, max_fps=20, quality=70, metrics=None):
+        self.render_frame = render_frame    # Returns the annotated BGR frame to stream
+        self.frame_version = frame_version  # Changes whenever render_frame would return something new
+        self.max_fps = max_fps
+        self.quality = quality
+        self.metrics = metrics
+
+        self.subscribers = 0
+        self.closed = False
+        self._chunk = None
+        self._seq = 0
+        self._thread = None
+        self._condition = threading.Condition()
+
+    def subscribe(self, timeout=1.0):
+        """Generator of multipart chunks for one client, newest frame first"""
+        with self._condition:
+            self.subscribers += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._encode_loop, daemon=True)
+                self._thread.start()
+
+        seen = 0
+        try:
+            while not self.closed:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._seq > seen or self.closed, timeout)
+                    if self._seq == seen or self.closed:
+                        continue
+                    if self.metrics is not None and seen and self._seq > seen + 1:
+                        self.metrics.increment('stream_frames_skipped', self._seq - seen - 1)
+                    chunk, seen = self._chunk, self._seq
+                yield chunk
+        finally:
+            with self._condition:
+                self.subscribers -= 1
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def _encode_loop(self):
+        """Runs while anyone is watching; encodes only when the frame version moves"""
+        interval = 1.0 / self.max_fps
+        last_version = None
+        while True:
+            with self._condition:
+                # Cleared under the lock so a new subscriber always starts a fresh thread
+                if self.closed or self.subscribers == 0:
+                    self._thread = None
+                    return
+            started = time.perf_counter()
+            try:
+                version = self.frame_version()
+                if version != last_version:
+                    frame = self.render_frame()
+                    encode_start = time.perf_counter()
+                    ret, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, self.quality])
+                    if self.metrics is not None:
+                        self.metrics.record('jpeg_encode', time.perf_counter() - encode_start)
+                        self.metrics.increment('frames_encoded')
+                    chunk = multipart_chunk(jpeg.tobytes()) if ret else placeholder_chunk("Encoding error")
+
+                    with self._condition:
+                        self._chunk = chunk
+                        self._seq += 1
+                        self._condition.notify_all()
+                    last_version = version
+            except Exception as e:
+                logger.error(f"MJPEG broadcast error: {e}")
+
+            time.sleep(max(0.0, interval - (time.perf_counter() - started)))
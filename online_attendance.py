@@ -866,30 +866,21 @@ class OnlineAttendanceManager:
     def _save_to_main_attendance(self, session):
         """Save online session attendance to main attendance system"""
         try:
-            from app import load_attendance_data, save_attendance_data
+            from app import save_attendance_marks
             
-            main_attendance = load_attendance_data()
             section_id = session['section_id']
             date_str = datetime.fromisoformat(session['start_time']).strftime('%Y-%m-%d')
             
-            if section_id not in main_attendance:
-                main_attendance[section_id] = {}
-            
-            if date_str not in main_attendance[section_id]:
-                main_attendance[section_id][date_str] = {}
-            
             # Get all students in section
             all_students = self._get_section_students(section_id)
             
             # Mark online attendance
+            marks = {}
             for student in all_students:
                 online_key = f"online_{session['subject']}_{student}"
-                if student in session['attendees']:
-                    main_attendance[section_id][date_str][online_key] = 1
-                else:
-                    main_attendance[section_id][date_str][online_key] = 0
+                marks[online_key] = 1 if student in session['attendees'] else 0
             
-            save_attendance_data(main_attendance)
+            save_attendance_marks(section_id, date_str, marks)
             
         except Exception as e:
             print(f"Error saving to main attendance: {e}")
@@ -0,0 +1,92 @@
+"""
+Pipeline Metrics - Rolling per-stage latency histograms for CameraProcessor
+Each stage (capture, resize, detection, encoding, JPEG encode, ...) keeps its
+most recent samples for percentiles plus fixed millisecond buckets, and the
+processor counts queue drops and skipped frames alongside them.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+
+# Upper bounds of the histogram buckets in milliseconds; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class RollingHistogram:
+    """Latency samples of one stage over the last `window` observations"""
+
+    def __init__(self, window=512):
+        self.samples = deque(maxlen=window)
+        self.total_count = 0
+
+    def record(self, seconds):
+        self.samples.append(seconds * 1000)
+        self.total_count += 1
+
+    def snapshot(self):
+        if not self.samples:
+            return {'count': self.total_count, 'window': 0}
+
+        values = np.fromiter(self.samples, dtype=np.float64, count=len(self.samples))
+        p50, p90, p99 = np.percentile(values, (50, 90, 99))
+        counts = np.bincount(np.searchsorted(BUCKET_BOUNDS_MS, values), minlength=len(BUCKET_BOUNDS_MS) + 1)
+        labels = [f'<={bound}ms' for bound in BUCKET_BOUNDS_MS] + [f'>{BUCKET_BOUNDS_MS[-1]}ms']
+        return {
+            'count': self.total_count,
+            'window': len(values),
+            'mean_ms': round(float(values.mean()), 2),
+            'p50_ms': round(float(p50), 2),
+            'p90_ms': round(float(p90), 2),
+            'p99_ms': round(float(p99), 2),
+            'max_ms': round(float(values.max()), 2),
+            'buckets': dict(zip(labels, counts.tolist()))
+        }
+
+
+class PipelineMetrics:
+    """Thread-safe stage timers and event counters for one camera session"""
+
+    def __init__(self, window=512):
+        self.window = window
+        self.started_at = time.time()
+        self._stages = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = RollingHistogram(self.window)
+            histogram.record(seconds)
+
+    @contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def increment(self, counter, amount=1):
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            stages = {stage: histogram.snapshot() for stage, histogram in self._stages.items()}
+            counters = dict(self._counters)
+        return {
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'stages': stages,
+            'counters': counters
+        }
+
+
+def stage_timer(metrics, stage):
+    """metrics.time(stage), or a no-op when no metrics are being collected"""
+    return metrics.time(stage) if metrics is not None else nullcontext()
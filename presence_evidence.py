@@ -0,0 +1,125 @@
+"""
+Presence Evidence - Temporal vote aggregation for face attendance
+Accumulates per-student match evidence across recognition frames in compact
+arrays indexed by student row (hit count, best distance, first and last seen)
+and marks a student present only after k of the last n recognition frames
+matched them, so a single lucky frame can no longer mark anyone present.
+Faces the tracker reused, or the quality gate skipped, carry an earlier
+frame's label and do not vote.
+"""
+
+import threading
+
+import numpy as np
+
+UNKNOWN = "Unknown"
+
+
+class PresenceEvidence:
+    """k-of-n presence votes over one section's students"""
+
+    def __init__(self, names, k=3, n=5, min_confidence=0.4):
+        if not 1 <= k <= n <= 32:
+            raise ValueError("presence votes need 1 <= k <= n <= 32")
+        self.k = k
+        self.n = n
+        self.min_confidence = min_confidence
+        self._window_mask = np.uint32((1 << n) - 1)
+        self._lock = threading.Lock()
+        self.frames = 0  # Recognition frames voted on so far
+        self._allocate(sorted(set(names) - {UNKNOWN}))
+
+    def _allocate(self, names):
+        self.names = names
+        self.rows = {name: row for row, name in enumerate(names)}
+        count = len(names)
+        self.hits = np.zeros(count, dtype=np.int32)
+        self.best_distance = np.full(count, np.inf, dtype=np.float32)
+        self.first_seen = np.full(count, np.nan, dtype=np.float64)
+        self.last_seen = np.full(count, np.nan, dtype=np.float64)
+        self.marked_at = np.full(count, np.nan, dtype=np.float64)  # When k-of-n was first reached
+        self.recent = np.zeros(count, dtype=np.uint32)  # Bit i set: matched i recognition frames ago
+
+    def __len__(self):
+        return len(self.names)
+
+    def rebind(self, names):
+        """Carry evidence over to a new gallery version's student list, by name"""
+        with self._lock:
+            old_rows, old = self.rows, (self.hits, self.best_distance, self.first_seen,
+                                        self.last_seen, self.marked_at, self.recent)
+            self._allocate(sorted(set(names) - {UNKNOWN}))
+            kept = [(row, old_rows[name]) for row, name in enumerate(self.names) if name in old_rows]
+            if not kept:
+                return
+            new_rows, previous_rows = (np.array(rows) for rows in zip(*kept))
+            for target, source in zip((self.hits, self.best_distance, self.first_seen,
+                                       self.last_seen, self.marked_at, self.recent), old):
+                target[new_rows] = source[previous_rows]
+
+    def reset(self):
+        """Forget every vote, e.g. when a session's attendance is reset"""
+        with self._lock:
+            self.frames = 0
+            self._allocate(self.names)
+
+    def update(self, recognized_faces, timestamp):
+        """Vote with one recognition frame's results; returns names that just became present"""
+        matched = {}
+        for face in recognized_faces:
+            # Only fresh encodings vote: a tracked face repeats the label of an earlier frame
+            if face.get('reused') or face.get('skipped'):
+                continue
+            row = self.rows.get(face['name'])
+            if row is None or face['confidence'] <= self.min_confidence:
+                continue
+            # Two faces matching one student in a frame still count as a single vote
+            matched[row] = max(matched.get(row, 0.0), face['confidence'])
+
+        with self._lock:
+            self.frames += 1
+            self.recent <<= np.uint32(1)
+            self.recent &= self._window_mask
+            if not matched:
+                return []
+
+            rows = np.fromiter(matched, dtype=np.intp, count=len(matched))
+            distances = 1.0 - np.fromiter(matched.values(), dtype=np.float32, count=len(matched))
+            self.recent[rows] |= np.uint32(1)
+            self.hits[rows] += 1
+            np.minimum.at(self.best_distance, rows, distances)
+            self.first_seen[rows] = np.where(np.isnan(self.first_seen[rows]), timestamp, self.first_seen[rows])
+            self.last_seen[rows] = timestamp
+
+            votes = self._votes(self.recent[rows])
+            newly_present = rows[(votes >= self.k) & np.isnan(self.marked_at[rows])]
+            self.marked_at[newly_present] = timestamp
+            return [self.names[row] for row in newly_present]
+
+    @staticmethod
+    def _votes(masks):
+        """Population count of each window bitmask"""
+        bits = np.unpackbits(masks.astype('<u4').view(np.uint8).reshape(-1, 4), axis=1)
+        return bits.sum(axis=1)
+
+    def is_present(self, name):
+        row = self.rows.get(name)
+        return row is not None and bool(not np.isnan(self.marked_at[row]))
+
+    def to_dict(self):
+        """{roll: evidence} for every student matched at least once"""
+        with self._lock:
+            seen = np.flatnonzero(self.hits)
+            votes = self._votes(self.recent[seen])
+            return {
+                self.names[row]: {
+                    'hits': int(self.hits[row]),
+                    'recent_votes': int(vote),
+                    'best_distance': round(float(self.best_distance[row]), 4),
+                    'first_seen': float(self.first_seen[row]),
+                    'last_seen': float(self.last_seen[row]),
+                    'present': bool(not np.isnan(self.marked_at[row])),
+                    'marked_at': None if np.isnan(self.marked_at[row]) else float(self.marked_at[row])
+                }
+                for row, vote in zip(seen, votes)
+            }
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Recognition Log - Append-only record of every recognition frame of a session
+A background writer appends one JSON line per recognition frame (nearest
+gallery match and distance of every face, track ids, quality skips) plus
+presence marks and gallery swaps, so the recognition loop never waits on
+disk. The replay tool recomputes attendance from a log under other
+tolerance and vote settings, to tune them on real classroom data.
+
+Usage:
+    python recognition_log.py database/recognition_logs/CSE_DS-20261017-093000.jsonl
+    python recognition_log.py session.jsonl --tolerance 0.35 0.41 0.45 --votes 2 3 --window 5
+"""
+
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from queue import Full, Queue
+
+from presence_evidence import PresenceEvidence
+
+logger = logging.getLogger(__name__)
+
+APP_ROOT = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(APP_ROOT, "database", "recognition_logs")
+
+
+def compact_face(face):
+    """The parts of one recognize_frame result needed to replay it"""
+    entry = {'name': face['name'], 'confidence': round(float(face['confidence']), 4)}
+    if 'track_id' in face:
+        entry['track'] = face['track_id']
+    if 'distance' in face:
+        entry['nearest'] = face['nearest']
+        entry['distance'] = round(face['distance'], 4)
+    if face.get('skipped'):
+        entry['skipped'] = face['skipped']
+    return entry
+
+
+class RecognitionLogWriter:
+    """Appends records to a JSON-lines file from a background thread; writes never block"""
+
+    def __init__(self, path, header=None, max_pending=4096):
+        self.path = path
+        self.written = 0
+        self.dropped = 0  # Records lost because the disk could not keep up
+        self._queue = Queue(maxsize=max_pending)
+        self._closed = False
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+        if header is not None:
+            self.write({'type': 'session', 't': time.time(), **header})
+
+    def write(self, record):
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+
+    def write_frame(self, timestamp, recognized_faces):
+        """Log one recognition frame; the faces are compacted on the writer thread"""
+        self.write({'type': 'frame', 't': timestamp, 'faces': recognized_faces})
+
+    def close(self, timeout=5.0):
+        """Flush what is queued and close the file"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            # A full queue behind a writer that stopped must not hang the session's shutdown
+            self._queue.put(None, timeout=timeout if self._thread.is_alive() else 0)
+        except Full:
+            logger.error(f"Recognition log {self.path} writer is not draining; {self._queue.qsize()} records lost")
+        self._thread.join(timeout=timeout)
+
+    def _write_loop(self):
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                failed = 0
+                while True:
+                    record = self._queue.get()
+                    if record is None:
+                        break
+                    try:
+                        if record['type'] == 'frame':
+                            record = {**record, 'faces': [compact_face(face) for face in record['faces']]}
+                        f.write(json.dumps(record, separators=(',', ':')) + '\n')
+                        self.written += 1
+                    except Exception as e:
+                        # One bad record is dropped; the rest of the session is still logged
+                        self.dropped += 1
+                        failed += 1
+                        if failed == 1:
+                            logger.error(f"Recognition log {self.path} dropped a record: {e}")
+                    # Batches whatever queued up while writing into one flush
+                    if self._queue.empty():
+                        f.flush()
+                if failed:
+                    logger.error(f"Recognition log {self.path} dropped {failed} records that could not be written")
+                f.write(json.dumps({'type': 'end', 't': time.time(), 'dropped': self.dropped},
+                                   separators=(',', ':')) + '\n')
+        except OSError as e:
+            logger.error(f"Recognition log {self.path} failed: {e}")
+
+
+def read_log(path):
+    """Yield the records of a log; a line torn by a crash ends the log"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring truncated record at the end of {path}")
+                return
+
+
+def replay(records, tolerance, votes=3, window=5, min_confidence=0.4):
+    """Recompute presence from logged frames; returns (present rolls, PresenceEvidence)
+
+    Only faces encoded in a frame vote, as in the live session: faces the
+    tracker reused or the quality gate skipped have no distance in the log.
+    """
+    frames = [record for record in records if record['type'] == 'frame']
+    names = {face['nearest'] for record in frames for face in record['faces'] if 'nearest' in face}
+    evidence = PresenceEvidence(names, k=votes, n=window, min_confidence=min_confidence)
+
+    present = set()
+    for record in frames:
+        faces = [{'name': face['nearest'], 'confidence': 1 - face['distance']} for face in record['faces']
+                 if 'nearest' in face and face['distance'] < tolerance]
+        present.update(evidence.update(faces, record['t']))
+    return present, evidence
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute face attendance from a recognition log")
+    parser.add_argument('log', help="Recognition log (.jsonl) written during a session")
+    parser.add_argument('--tolerance', type=float, nargs='+', help="Match tolerances to try (default: the session's)")
+    parser.add_argument('--votes', type=int, nargs='+', help="Presence votes k to try (default: the session's)")
+    parser.add_argument('--window', type=int, help="Vote window n in recognition frames (default: the session's)")
+    parser.add_argument('--min-confidence', type=float, help="Minimum confidence of a vote (default: the session's)")
+    args = parser.parse_args()
+
+    records = list(read_log(args.log))
+    header = next((record for record in records if record['type'] == 'session'), {})
+    recorded = set()
+    for record in records:
+        if record['type'] == 'present':
+            recorded.update(record['students'])
+    frames = sum(1 for record in records if record['type'] == 'frame')
+
+    tolerances = args.tolerance or [header.get('tolerance', 0.41)]
+    votes_options = args.votes or [header.get('presence_votes', 3)]
+    window = args.window or header.get('presence_window', 5)
+    min_confidence = args.min_confidence if args.min_confidence is not None else header.get('min_confidence', 0.4)
+
+    print(f"Session {header.get('session_id', '?')} ({header.get('section', '?')}): {frames} recognition frames, "
+          f"{len(recorded)} marked present live")
+    for tolerance in tolerances:
+        for votes in votes_options:
+            present, _ = replay(records, tolerance, votes, window, min_confidence)
+            gained, lost = sorted(present - recorded), sorted(recorded - present)
+            print(f"tolerance={tolerance:.3f} votes={votes}/{window}: {len(present)} present"
+                  f"  +{len(gained)} {' '.join(gained)}  -{len(lost)} {' '.join(lost)}")
+
+
+if __name__ == '__main__':
+    main()
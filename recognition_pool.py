@@ -0,0 +1,94 @@
+"""
+Recognition Pool - Multi-process face recognition backend
+Fans frames out to worker processes so HOG detection and encoding use more
+than one core. Every worker maps the same section slice of the encoding store
+read-only, so the gallery pages are shared through the OS page cache.
+"""
+
+import logging
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from encoding_store import EncodingStore
+from face_matcher import FaceMatcher
+from face_pipeline import recognize_frame
+
+logger = logging.getLogger(__name__)
+
+# Pools are created inside the threaded web app, and a plain fork there can copy a lock some other
+# thread holds (logging, file locks, OpenCV) into a child that then deadlocks on it. forkserver forks
+# workers from a single-threaded server that imported the app and dlib once; Windows only offers spawn
+POOL_CONTEXT = mp.get_context('forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn')
+if POOL_CONTEXT.get_start_method() == 'forkserver':
+    POOL_CONTEXT.set_forkserver_preload(['__main__', 'recognition_pool', 'group_photo', 'enrollment'])
+
+
+def make_executor(workers):
+    """ProcessPoolExecutor on the same start method as the recognition pool, for one-off batch jobs"""
+    return ProcessPoolExecutor(max_workers=workers, mp_context=POOL_CONTEXT)
+
+# Seconds between checks for a newly published gallery version
+VERSION_CHECK_INTERVAL = 5.0
+
+# Per-process gallery state, set by _init_worker and refreshed by _refresh_matcher
+_worker_store = None
+_worker_section = None
+_worker_matcher_options = {}
+_worker_pipeline_options = {}
+_worker_matcher = None
+_worker_version = None
+_worker_checked_at = 0.0
+
+
+def _init_worker(store_dir, sections, section_id, matcher_options, pipeline_options):
+    """Open the section's gallery slice in this worker process"""
+    global _worker_store, _worker_section, _worker_matcher_options, _worker_pipeline_options
+    _worker_store = EncodingStore(store_dir, sections)
+    _worker_section = section_id
+    _worker_matcher_options = matcher_options
+    _worker_pipeline_options = pipeline_options
+    _refresh_matcher(force=True)
+
+
+def _refresh_matcher(force=False):
+    """Reload the section slice when a new gallery version has been published"""
+    global _worker_matcher, _worker_version, _worker_checked_at
+    now = time.time()
+    if not force and now - _worker_checked_at < VERSION_CHECK_INTERVAL:
+        return
+    _worker_checked_at = now
+    version = _worker_store.current_version()
+    if force or version != _worker_version:
+        encodings, names = _worker_store.load_section(_worker_section)
+        _worker_matcher = FaceMatcher(encodings, names, **_worker_matcher_options)
+        _worker_version = version
+
+
+def _recognize_in_worker(frame):
+    try:
+        _refresh_matcher()
+        return recognize_frame(frame, _worker_matcher, **_worker_pipeline_options)
+    except Exception as e:
+        logger.error(f"Worker face recognition error: {e}")
+        return []
+
+
+class RecognitionWorkerPool:
+    """Process pool that recognizes frames and hands results back in submission order"""
+
+    def __init__(self, workers, store_dir, sections, section_id, matcher_options=None, pipeline_options=None):
+        self.workers = workers
+        self.pool = POOL_CONTEXT.Pool(
+            processes=workers,
+            initializer=_init_worker,
+            initargs=(store_dir, sections, section_id, matcher_options or {}, pipeline_options or {})
+        )
+
+    def submit(self, frame):
+        """Queue a frame; returns an AsyncResult resolving to its recognized faces"""
+        return self.pool.apply_async(_recognize_in_worker, (frame,))
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
@@ -0,0 +1,163 @@
+"""
+Roll Resolver - Roll number to section lookup compiled from SECTIONS
+The section configuration is compiled once into a character trie of roll
+prefixes, each leading to a range table that maps the numeric part of a
+roll straight to its section. Resolving a roll is a walk over its prefix
+and one table read, instead of a loop over every section with string
+slicing and int() parsing. resolve_many does the same for a whole array of
+rolls at once with numpy.
+
+A resolved roll gives its section id, its numeric section code (position in
+SECTIONS) and its row inside the section (number - start), the row the
+roll occupies in get_section_students.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+RollInfo = namedtuple('RollInfo', ['section', 'code', 'row', 'number'])
+
+MAX_DIGITS = 9  # Longer numeric parts cannot be in any range table
+
+_PREFIX_END = None  # Trie key marking that a prefix ends at this node
+
+
+class _RangeTable:
+    """Section code of every number between the lowest start and highest end of one prefix"""
+
+    def __init__(self, prefix, ranges):
+        self.prefix = prefix
+        self.low = min(start for start, _, _ in ranges)
+        high = max(end for _, end, _ in ranges)
+        self.codes = np.full(high - self.low + 1, -1, dtype=np.int16)
+        for start, end, code in ranges:
+            overlap = self.codes[start - self.low:end - self.low + 1]
+            if (overlap >= 0).any():
+                raise ValueError(f"Roll ranges of prefix {prefix!r} overlap")
+            overlap[:] = code
+
+    def lookup(self, number):
+        offset = number - self.low
+        if 0 <= offset < len(self.codes):
+            return int(self.codes[offset])
+        return -1
+
+
+class RollResolver:
+    """Constant-time roll number → (section, code, row) lookups for one SECTIONS layout"""
+
+    def __init__(self, sections):
+        self.sections = list(sections)  # Section ids; a section's code is its index here
+        self.codes = {section_id: code for code, section_id in enumerate(self.sections)}
+        self.prefixes = [config['prefix'] for config in sections.values()]
+        self.starts = np.array([config['start'] for config in sections.values()], dtype=np.int32)
+        self.sizes = np.array([config['end'] - config['start'] + 1 for config in sections.values()], dtype=np.int32)
+
+        ranges = {}
+        for code, config in enumerate(sections.values()):
+            ranges.setdefault(config['prefix'], []).append((config['start'], config['end'], code))
+        self.tables = [_RangeTable(prefix, prefix_ranges) for prefix, prefix_ranges in ranges.items()]
+
+        self._trie = {}
+        for table in self.tables:
+            node = self._trie
+            for char in table.prefix:
+                node = node.setdefault(char, {})
+            node[_PREFIX_END] = table
+
+    def code_of(self, section_id):
+        """Numeric code of a section id, or -1"""
+        return self.codes.get(section_id, -1)
+
+    def rolls(self, section_id):
+        """Every roll number of a section, in row order"""
+        code = self.code_of(section_id)
+        if code < 0:
+            return []
+        start = int(self.starts[code])
+        return [f"{self.prefixes[code]}{number:03d}" for number in range(start, start + int(self.sizes[code]))]
+
+    # ----- one roll -----
+
+    def resolve(self, roll_number):
+        """RollInfo of a roll number, or None when no section contains it"""
+        if not isinstance(roll_number, str):
+            return None
+        node = self._trie
+        matches = []
+        for position, char in enumerate(roll_number):
+            node = node.get(char)
+            if node is None:
+                break
+            if _PREFIX_END in node:
+                matches.append((position + 1, node[_PREFIX_END]))
+
+        # Longest prefix first; the rest of the roll must be its number
+        for length, table in reversed(matches):
+            digits = roll_number[length:]
+            if not digits or len(digits) > MAX_DIGITS or not digits.isascii() or not digits.isdigit():
+                continue
+            number = int(digits)
+            code = table.lookup(number)
+            if code >= 0:
+                return RollInfo(self.sections[code], code, number - int(self.starts[code]), number)
+        return None
+
+    def section(self, roll_number):
+        """Section id of a roll number, or None"""
+        info = self.resolve(roll_number)
+        return info.section if info else None
+
+    # ----- arrays of rolls -----
+
+    def resolve_many(self, roll_numbers):
+        """(codes, rows) arrays for a sequence of rolls; -1 in both where no section contains a roll"""
+        rolls = np.asarray(roll_numbers, dtype=str)
+        count = len(rolls)
+        codes = np.full(count, -1, dtype=np.int16)
+        rows = np.full(count, -1, dtype=np.int32)
+        if count == 0:
+            return codes, rows
+
+        # One row of code points per roll, zero-padded on the right
+        width = max(rolls.dtype.itemsize // 4, 1)
+        points = rolls.view(np.uint32).reshape(count, width)
+
+        # Longest prefixes first, so only rolls still unresolved are tried against shorter ones
+        for table in sorted(self.tables, key=lambda table: len(table.prefix), reverse=True):
+            length = len(table.prefix)
+            if length >= width:
+                continue
+            prefix_points = np.frombuffer(table.prefix.encode('utf-32-le'), dtype=np.uint32)
+            candidates = (codes < 0) & (points[:, :length] == prefix_points).all(axis=1)
+
+            tail = points[:, length:]
+            is_digit = (tail >= ord('0')) & (tail <= ord('9'))
+            digit_count = is_digit.sum(axis=1)
+            # Digits up to the padding and nothing after them
+            candidates &= (digit_count > 0) & (digit_count <= MAX_DIGITS)
+            candidates &= (is_digit | (tail == 0)).all(axis=1)
+            candidates &= digit_count == (tail != 0).sum(axis=1)
+            if not candidates.any():
+                continue
+
+            numbers = np.zeros(count, dtype=np.int64)
+            for column in range(tail.shape[1]):
+                digit = is_digit[:, column]
+                numbers = np.where(digit, numbers * 10 + (tail[:, column].astype(np.int64) - ord('0')), numbers)
+
+            offsets = numbers - table.low
+            candidates &= (offsets >= 0) & (offsets < len(table.codes))
+            found = np.flatnonzero(candidates)
+            found_codes = table.codes[offsets[found]]
+            hit = found_codes >= 0
+            found, found_codes = found[hit], found_codes[hit]
+            codes[found] = found_codes
+            rows[found] = numbers[found] - self.starts[found_codes]
+        return codes, rows
+
+    def sections_of(self, roll_numbers):
+        """Section id (or None) of every roll in a sequence"""
+        codes, _ = self.resolve_many(roll_numbers)
+        return [self.sections[code] if code >= 0 else None for code in codes]
@@ -0,0 +1,80 @@
+"""
+Session Events - Sequence-numbered change feed of one attendance session
+Camera processors and attendance routes publish deltas (newly present
+students, face boxes, fps) into a bounded in-memory log; Server-Sent Event
+clients wait on it and resume from the last sequence number they saw.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+
+# Each of these replaces the previous one, so a resuming client only needs the latest
+STATE_EVENTS = ('faces', 'stats')
+
+
+def format_sse(seq, event_type, data):
+    """Wire format of one Server-Sent Event; `data` is JSON text"""
+    return f"id: {seq}\nevent: {event_type}\ndata: {data}\n\n"
+
+
+class SessionEvent:
+    __slots__ = ('seq', 'type', 'data', 'time')
+
+    def __init__(self, seq, event_type, data):
+        self.seq = seq
+        self.type = event_type
+        self.data = json.dumps(data)  # Serialized once, however many clients stream it
+        self.time = time.time()
+
+    def to_sse(self):
+        return format_sse(self.seq, self.type, self.data)
+
+
+class SessionEventLog:
+    """Bounded, thread-safe log of session events with blocking reads"""
+
+    def __init__(self, capacity=1024):
+        self._events = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self.last_seq = 0
+        self.closed = False
+
+    def publish(self, event_type, data):
+        """Append an event with a JSON-serializable payload and wake every waiting client; returns its seq"""
+        with self._condition:
+            self.last_seq += 1
+            self._events.append(SessionEvent(self.last_seq, event_type, data))
+            self._condition.notify_all()
+            return self.last_seq
+
+    def close(self):
+        """Wake waiting clients for good once the session is gone"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def since(self, seq):
+        """(events after seq, complete); complete is False when some were already evicted
+
+        Of the state events only the newest of each type is returned. A seq
+        from the future (the server restarted since) is incomplete as well.
+        """
+        with self._condition:
+            events = [event for event in self._events if event.seq > seq]
+            oldest = self._events[0].seq if self._events else self.last_seq + 1
+            complete = oldest - 1 <= seq <= self.last_seq
+
+        latest_state = {}
+        for event in events:
+            if event.type in STATE_EVENTS:
+                latest_state[event.type] = event.seq
+        return [event for event in events
+                if event.type not in STATE_EVENTS or latest_state[event.type] == event.seq], complete
+
+    def wait(self, seq, timeout):
+        """Block until an event after seq exists or the log is closed; True if there is news"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.last_seq > seq or self.closed, timeout)
+            return self.last_seq > seq
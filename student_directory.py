@@ -0,0 +1,121 @@
+"""
+Student Directory - details.json loaded once and indexed in memory
+The student list is parsed once, indexed by roll number and by section, and
+each student's CGPA and latest SGPA are computed up front, so lookups inside
+per-student loops are dictionary reads instead of a re-parse plus a linear
+scan. The index is rebuilt when its version key (the file's mtime and size)
+changes. Records are shared between callers and must not be modified; copy
+one before adding fields to it.
+"""
+
+import logging
+
+from roll_resolver import RollResolver
+from versioned_cache import VersionedCache
+
+logger = logging.getLogger(__name__)
+
+
+def calculate_cgpa(sgpas):
+    """Mean of the numeric SGPA values, rounded to 2 places; 0.0 when there are none"""
+    values = []
+    for sgpa in (sgpas or {}).values():
+        try:
+            values.append(float(sgpa))
+        except (ValueError, TypeError):
+            continue
+    return round(sum(values) / len(values), 2) if values else 0.0
+
+
+def latest_sgpa(sgpas):
+    """SGPA of the highest numbered semester, or 'N/A'"""
+    semesters = [int(sem) for sem in (sgpas or {}) if str(sem).isdigit()]
+    if not semesters:
+        return 'N/A'
+    latest = max(semesters)
+    return sgpas.get(str(latest), sgpas.get(latest, 'N/A'))
+
+
+def placeholder_student(roll_number):
+    """Record used for roll numbers missing from the student list"""
+    return {'rollNo': roll_number, 'name': f"Student {roll_number}", 'mobile': 'N/A', 'sgpas': {}}
+
+
+class _StudentIndex:
+    """One immutable build of the directory"""
+
+    def __init__(self, records, resolver):
+        self.records = records
+        self.by_roll = {}
+        self.cgpa = {}
+        self.latest_sgpa = {}
+        for record in records:
+            roll = record.get('rollNo')
+            if not roll:
+                continue
+            sgpas = record.get('sgpas')
+            if not isinstance(sgpas, dict):
+                sgpas = {}
+            self.by_roll[roll] = record
+            self.cgpa[roll] = calculate_cgpa(sgpas)
+            self.latest_sgpa[roll] = latest_sgpa(sgpas)
+
+        # Every roll number of a section's range, in order, with placeholders for gaps
+        self.by_section = {}
+        for section_id in resolver.sections:
+            self.by_section[section_id] = [self.by_roll.get(roll) or placeholder_student(roll)
+                                           for roll in resolver.rolls(section_id)]
+
+
+class StudentDirectory:
+    """Shared, lazily rebuilt index of the student list"""
+
+    def __init__(self, load, version, sections, check_interval=1.0):
+        self.load = load  # () -> list of {'rollNo', 'name', 'mobile', 'sgpas'} records
+        self.resolver = RollResolver(sections)
+        self._cache = VersionedCache(self._build_index, version, check_interval)
+
+    def _build_index(self):
+        index = _StudentIndex(self.load(), self.resolver)
+        logger.info(f"Indexed {len(index.by_roll)} students")
+        return index
+
+    @property
+    def loads(self):
+        """How many times the student list has been (re)loaded"""
+        return self._cache.loads
+
+    def invalidate(self):
+        self._cache.invalidate()
+
+    def get(self, roll_number):
+        """The student's record, or None"""
+        return self._cache.get().by_roll.get(roll_number)
+
+    def info(self, roll_number):
+        """The student's record, or a placeholder for unknown roll numbers"""
+        return self.get(roll_number) or placeholder_student(roll_number)
+
+    def cgpa(self, roll_number):
+        return self._cache.get().cgpa.get(roll_number, 0.0)
+
+    def latest_sgpa(self, roll_number):
+        return self._cache.get().latest_sgpa.get(roll_number, 'N/A')
+
+    def section_students(self, section_id):
+        """Records of every roll number in the section, in roll order"""
+        return self._cache.get().by_section.get(section_id, [])
+
+    def by_roll(self):
+        """{roll number: record} for every student"""
+        return self._cache.get().by_roll
+
+    def records(self):
+        """The student list as loaded"""
+        return self._cache.get().records
+
+    def __contains__(self, roll_number):
+        return roll_number in self._cache.get().by_roll
+
+    def __len__(self):
+        return len(self._cache.get().by_roll)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test script for the append-only attendance log and its compaction
+"""
+
+import json
+import os
+import tempfile
+
+from attendance_log import AttendanceLog
+
+SECTIONS = ["CSE_DS", "CSEAIML_A"]
+
+
+def _snapshot(tmp, data):
+    path = os.path.join(tmp, "attendance.json")
+    with open(path, 'w') as f:
+        json.dump(data, f)
+    return path
+
+
+def test_saves_append_events_without_rewriting_snapshot():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _snapshot(tmp, {"CSE_DS": {"2026-10-16": {"23CSEDS001": 1, "23CSEDS002": 0}}})
+        log = AttendanceLog(path, SECTIONS)
+        before = log.view()
+
+        log.record("CSE_DS", "2026-10-17", {"23CSEDS001": 0, "23CSEDS002": 1})
+        log.record("CSE_DS", "2026-10-17", {"23CSEDS001": 1})
+        after = log.view()
+
+        assert after["CSE_DS"]["2026-10-17"] == {"23CSEDS001": 1, "23CSEDS002": 1}
+        assert after["CSEAIML_A"] == {}
+        # Views handed out earlier never change underneath their reader
+        assert "2026-10-17" not in before["CSE_DS"]
+        assert after["CSE_DS"]["2026-10-16"] is before["CSE_DS"]["2026-10-16"]
+
+        with open(path) as f:
+            assert "2026-10-17" not in json.load(f)["CSE_DS"]
+        with open(log.log_path) as f:
+            assert len(f.readlines()) == 2
+        assert log.version == 2 and log.pending_events == 2
+        print("✅ Saving a section's day appends one event")
+
+
+def test_restart_replays_log_and_compaction_folds_it():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _snapshot(tmp, {"CSE_DS": {"2026-10-17": {"23CSEDS001": 1, "23CSEDS002": 1}}})
+        log = AttendanceLog(path, SECTIONS)
+        log.record("CSE_DS", "2026-10-17", {"23CSEDS003": 0}, replace=True)
+        log.record("CSEAIML_A", "2026-10-17", {"23CSEAIML001": 1})
+        # A crash in the middle of an append leaves a torn line behind
+        with open(log.log_path, 'a') as f:
+            f.write('{"section": "CSE_')
+
+        restarted = AttendanceLog(path, SECTIONS)
+        expected = {"CSE_DS": {"2026-10-17": {"23CSEDS003": 0}},
+                    "CSEAIML_A": {"2026-10-17": {"23CSEAIML001": 1}}}
+        assert restarted.view() == expected
+        restarted.record("CSE_DS", "2026-10-18", {"23CSEDS001": 1})
+
+        assert restarted.compact()
+        assert not restarted.compact()  # Nothing left to fold
+        assert not os.path.exists(restarted.log_path)
+        with open(path) as f:
+            compacted = json.load(f)
+        assert compacted == {**expected, "CSE_DS": {**expected["CSE_DS"], "2026-10-18": {"23CSEDS001": 1}}}
+        assert AttendanceLog(path, SECTIONS).view() == compacted
+        print("✅ Restarts replay the log and compaction folds it into the snapshot")
+
+
+def test_interrupted_compaction_is_replayed():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _snapshot(tmp, {})
+        log = AttendanceLog(path, SECTIONS)
+        log.record("CSE_DS", "2026-10-17", {"23CSEDS001": 1})
+        # Crash after rotating the log but before the snapshot was written
+        os.replace(log.log_path, log.log_path + ".compacting")
+        log.record("CSE_DS", "2026-10-17", {"23CSEDS002": 1})
+
+        restarted = AttendanceLog(path, SECTIONS)
+        assert restarted.view()["CSE_DS"]["2026-10-17"] == {"23CSEDS001": 1, "23CSEDS002": 1}
+        assert restarted.compact()
+        assert not os.path.exists(restarted.log_path + ".compacting")
+        assert AttendanceLog(path, SECTIONS).view() == restarted.view()
+        print("✅ An interrupted compaction loses nothing")
+
+
+def test_changes_from_other_processes_are_picked_up():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _snapshot(tmp, {"CSE_DS": {}})
+        log = AttendanceLog(path, SECTIONS, check_interval=0)
+        other_worker = AttendanceLog(path, SECTIONS, check_interval=0)
+        first = log.view()
+        assert log.view() is first  # Unchanged files are not re-read
+
+        other_worker.record("CSE_DS", "2026-10-17", {"23CSEDS001": 1})
+        assert log.view()["CSE_DS"]["2026-10-17"] == {"23CSEDS001": 1}
+        # Appending on top of the other worker's event keeps both
+        log.record("CSE_DS", "2026-10-17", {"23CSEDS002": 0})
+        assert other_worker.view()["CSE_DS"]["2026-10-17"] == {"23CSEDS001": 1, "23CSEDS002": 0}
+        print("✅ Writes by other processes invalidate the view")
+
+
+def test_readers_leave_an_append_in_flight_alone():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _snapshot(tmp, {})
+        writer = AttendanceLog(path, SECTIONS)
+        writer.record("CSE_DS", "2026-10-17", {"23CSEDS001": 1})
+        # Another process is halfway through writing its event
+        with open(writer.log_path, 'a') as f:
+            f.write('{"section":"CSE_DS","date":"2026-10-17","marks":{"23CSEDS0')
+        with open(writer.log_path, 'rb') as f:
+            before = f.read()
+
+        reader = AttendanceLog(path, SECTIONS)
+        assert reader.view()["CSE_DS"] == {"2026-10-17": {"23CSEDS001": 1}}
+        with open(writer.log_path, 'rb') as f:
+            assert f.read() == before
+
+        # The rest of the line lands and the next look picks the event up
+        with open(writer.log_path, 'a') as f:
+            f.write('02":1}}\n')
+        reader._checked_at = 0.0
+        assert reader.view()["CSE_DS"]["2026-10-17"] == {"23CSEDS001": 1, "23CSEDS002": 1}
+        print("✅ Readers stop at a half-written event without touching the log")
+
+
+def test_compaction_keeps_other_processes_events():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _snapshot(tmp, {"CSE_DS": {}})
+        log = AttendanceLog(path, SECTIONS, check_interval=60)
+        other_worker = AttendanceLog(path, SECTIONS, check_interval=60)
+        log.record("CSE_DS", "2026-10-16", {"23CSEDS001": 1})
+        other_worker.record("CSEAIML_A", "2026-10-16", {"23CSEAIML001": 1})
+
+        # The compacting worker's view predates the other worker's event
+        assert log.compact()
+        expected = {"CSE_DS": {"2026-10-16": {"23CSEDS001": 1}},
+                    "CSEAIML_A": {"2026-10-16": {"23CSEAIML001": 1}}}
+        with open(path) as f:
+            assert json.load(f) == expected
+        assert not os.path.exists(log.log_path)
+        assert AttendanceLog(path, SECTIONS).view() == expected
+        assert other_worker.compact() is False  # Nothing left to fold
+        assert other_worker.view() == expected
+        print("✅ Compaction folds events appended by other processes")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing attendance log...\n")
+    test_saves_append_events_without_rewriting_snapshot()
+    test_restart_replays_log_and_compaction_folds_it()
+    test_interrupted_compaction_is_replayed()
+    test_changes_from_other_processes_are_picked_up()
+    test_readers_leave_an_append_in_flight_alone()
+    test_compaction_keeps_other_processes_events()
+    print("\n🎉 All attendance log tests passed!")
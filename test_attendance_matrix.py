@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for the columnar attendance matrix and its analytics
+"""
+
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from attendance_matrix import NC, AttendanceMatrices
+from roll_resolver import RollResolver
+
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 3},
+    "CSEAIML_C": {"prefix": "23CSEAIML", "start": 129, "end": 204},
+}
+
+TIMETABLE = {
+    "CSE_DS": {"Monday": ["Maths", "Physics"], "Tuesday": ["Maths", "Maths"]},
+    "CSEAIML_C": {day: ["AI", "ML", "DL", "Python"] for day in
+                  ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]},
+}
+
+# 2026-10-12 is a Monday, 2026-10-19 the Monday after
+RECORDS = {
+    "2026-10-13": {"23CSEDS001": 0, "23CSEDS002": 1, "Maths_23CSEDS001": 1},
+    "2026-10-12": {"23CSEDS001": 1, "23CSEDS002": 0, "Physics_23CSEDS002": 1, "23CSEDS003": "?",
+                   "23CSEAIML129": 1, "online_Maths_23CSEDS003": 1},
+    "2026-10-18": {"23CSEDS001": 1, "23CSEDS002": 1},  # Sunday: no classes
+    "2026-10-19": {"23CSEDS001": 1},
+    "not-a-date": {"23CSEDS001": 1},
+}
+
+
+def test_sessions_follow_the_timetable():
+    matrices = AttendanceMatrices(RollResolver(SECTIONS), TIMETABLE)
+    matrix = matrices.section("CSE_DS", RECORDS)
+
+    assert matrix.date_strings == ["2026-10-12", "2026-10-13", "2026-10-18", "2026-10-19"]
+    assert matrix.days.dtype == np.int8 and matrix.days.shape == (3, 4)
+    assert matrix.days[:, 0].tolist() == [1, 0, NC]  # Other sections' rolls are not rows here
+    # Mon: Maths, Physics; Tue: Maths once; Sun: none; Mon: Maths, Physics
+    assert [matrix.subjects[code] for code in matrix.session_subjects] == ["Maths", "Physics", "Maths", "Maths", "Physics"]
+    assert matrix.sessions[0].tolist() == [1, 1, 1, 1, 1]  # Subject mark wins over the day's absence
+    assert matrix.sessions[1].tolist() == [0, 1, 1, NC, NC]
+    assert matrix.sessions[2].tolist() == [NC] * 5
+
+    assert matrix.percentage(0) == 100.0 and matrix.percentage(1) == 66.7 and matrix.percentage(2) == 0
+    assert matrix.percentages().tolist() == [100.0, 66.7, 0.0]
+    print("✅ Percentages count timetabled classes and skip NC")
+
+
+def test_streaks_daily_and_weekly():
+    matrices = AttendanceMatrices(RollResolver(SECTIONS), TIMETABLE)
+    matrix = matrices.section("CSE_DS", RECORDS)
+
+    assert matrix.current_streaks().tolist() == [5, 2, 0]
+    assert matrix.daily_present().tolist() == [1, 1, 2, 1]
+    assert matrix.daily_rates().tolist() == [33.33, 33.33, 66.67, 33.33]
+    weeks, present, days = matrix.weekly()
+    assert [str(week) for week in weeks] == ["2026-10-12", "2026-10-19"]
+    assert present.tolist() == [4, 1] and days.tolist() == [3, 1]
+    print("✅ Streaks, daily rates and weekly trends are reductions over the matrix")
+
+
+def test_matrix_is_rebuilt_only_for_new_records():
+    matrices = AttendanceMatrices(RollResolver(SECTIONS), TIMETABLE)
+    first = matrices.section("CSE_DS", RECORDS)
+    assert matrices.section("CSE_DS", RECORDS) is first
+    assert matrices.section("CSEAIML_C", None).sessions.shape == (76, 0)
+    assert matrices.section("CSEAIML_C", {}) is matrices.section("CSEAIML_C", None)
+
+    # The copy-on-write view hands out a new section dict after every save
+    updated = {**RECORDS, "2026-10-20": {"23CSEDS003": 1}}
+    assert matrices.section("CSE_DS", updated) is not first
+    assert matrices.section("CSE_DS", updated).percentage(2) == 100.0
+    assert matrices.builds == 3
+    print("✅ Matrices are cached until their section's records change")
+
+
+def test_year_of_a_large_section():
+    rng = np.random.default_rng(7)
+    start = date(2026, 1, 1)
+    records = {}
+    for day in range(365):
+        statuses = rng.integers(0, 2, size=76)
+        records[(start + timedelta(days=day)).isoformat()] = {
+            f"23CSEAIML{129 + row:03d}": int(status) for row, status in enumerate(statuses)}
+
+    matrix = AttendanceMatrices(RollResolver(SECTIONS), TIMETABLE).section("CSEAIML_C", records)
+    assert matrix.sessions.shape == (76, 313 * 4)  # Sundays have no classes
+
+    started = time.perf_counter()
+    percentages = matrix.percentages()
+    matrix.current_streaks(), matrix.daily_rates(), matrix.weekly()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    assert 40 < percentages.mean() < 60
+    print(f"✅ A year of a 76-student section analysed in {elapsed_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing attendance matrix...\n")
+    test_sessions_follow_the_timetable()
+    test_streaks_daily_and_weekly()
+    test_matrix_is_rebuilt_only_for_new_records()
+    test_year_of_a_large_section()
+    print("\n🎉 All attendance matrix tests passed!")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for the registry of concurrent face attendance sessions
+"""
+
+import time
+
+from attendance_sessions import AttendanceSession, AttendanceSessionRegistry
+
+
+class RunningCamera:
+    """Stands in for a CameraProcessor whose camera is open"""
+
+    def __init__(self):
+        self.is_running = True
+        self.gallery_version = 1
+        self.present_students = set()
+        self.evidence = None
+        self.events = None
+
+    def stop_processing(self):
+        self.is_running = False
+
+
+def test_get_or_create_and_add():
+    registry = AttendanceSessionRegistry()
+    room = registry.get_or_create("LAB1", "CSE_DS", "dr.smith")
+    assert registry.get_or_create("LAB1", "CSE_DS", "prof.johnson") is room
+    assert room.started_by == "dr.smith" and registry.get("LAB1") is room
+
+    # A session started elsewhere under the same id wins over a late one
+    late = AttendanceSession("LAB1", "CSE_DS", "prof.johnson")
+    assert registry.add(late) is room
+    fresh = AttendanceSession("LAB2", "CSEAIML_A", "prof.johnson")
+    assert registry.add(fresh) is fresh and registry.add(fresh) is fresh
+    assert {s.session_id for s in registry.list()} == {"LAB1", "LAB2"}
+    print("✅ Sessions are created once per id")
+
+
+def test_latest_for_user_and_present_for_section():
+    registry = AttendanceSessionRegistry()
+    first = registry.get_or_create("LAB1", "CSEAIML_A", "dr.smith")
+    time.sleep(0.001)  # started_at has microsecond resolution
+    second = registry.get_or_create("LAB2", "CSEAIML_A", "dr.smith")
+    other = registry.get_or_create("CSE_DS", "CSE_DS", "prof.johnson")
+
+    assert registry.latest_for_user("dr.smith") is second
+    assert registry.latest_for_user("prof.johnson") is other
+    assert registry.latest_for_user("nobody") is None
+
+    first.present_students.update({"23CSEAIML001", "23CSEAIML002"})
+    second.present_students.add("23CSEAIML002")
+    second.present_students.add("23CSEAIML003")
+    other.present_students.add("23CSEDS001")
+    assert registry.present_for_section("CSEAIML_A") == {"23CSEAIML001", "23CSEAIML002", "23CSEAIML003"}
+    assert registry.present_for_section("CSEAIML_B") == set()
+    print("✅ Clients without a session id get their latest session; sections union their rooms")
+
+
+def test_remove_stops_camera_and_closes_feed():
+    registry = AttendanceSessionRegistry()
+    attendance_session = registry.get_or_create("LAB1", "CSE_DS", "dr.smith")
+    camera = RunningCamera()
+    attendance_session.camera_processor = camera
+    assert attendance_session.is_running and attendance_session.to_dict()['running']
+
+    assert registry.remove("LAB1") is attendance_session
+    assert not camera.is_running and attendance_session.camera_processor is None
+    assert attendance_session.events.closed
+    assert registry.get("LAB1") is None and registry.remove("LAB1") is None
+
+    registry.get_or_create("A", "CSE_DS", "dr.smith")
+    registry.get_or_create("B", "CSE_DS", "dr.smith")
+    registry.get_or_create("C", "CSE_DS", "prof.johnson")
+    assert registry.remove_for_user("dr.smith") == 2
+    assert [s.session_id for s in registry.list()] == ["C"]
+    print("✅ Removing a session stops its camera and closes its event feed")
+
+
+def test_one_start_at_a_time():
+    registry = AttendanceSessionRegistry()
+    with registry.starting("LAB1") as claimed:
+        assert claimed
+        # A second start of the same id, registered or not, is turned away while the camera opens
+        with registry.starting("LAB1") as again:
+            assert not again
+        with registry.starting("LAB2") as other:
+            assert other
+    with registry.starting("LAB1") as claimed:
+        assert claimed
+
+    attendance_session = registry.get_or_create("LAB1", "CSE_DS", "dr.smith")
+    attendance_session.camera_processor = RunningCamera()
+    with registry.starting("LAB1") as claimed:
+        assert not claimed
+    attendance_session.stop()
+    with registry.starting("LAB1") as claimed:
+        assert claimed
+    print("✅ A session's camera is started by one request at a time")
+
+
+def test_restart_begins_from_a_clean_slate():
+    registry = AttendanceSessionRegistry()
+    # Left behind by a manual save or an earlier run
+    attendance_session = registry.get_or_create("CSE_DS", "CSE_DS", "dr.smith")
+    attendance_session.present_students.update({"23CSEDS001", "23CSEDS002"})
+    attendance_session.evidence = object()
+    stale_start = attendance_session.started_at
+
+    time.sleep(0.001)
+    camera = RunningCamera()
+    attendance_session.begin_run("prof.johnson", camera)
+    assert attendance_session.started_by == "prof.johnson" and attendance_session.started_at != stale_start
+    assert attendance_session.present_students == set() and attendance_session.present_students is camera.present_students
+    assert attendance_session.evidence is None and camera.events is attendance_session.events
+    assert attendance_session.is_running and registry.latest_for_user("dr.smith") is None
+    assert camera.present_lock is attendance_session.lock
+
+    # Group photos and manual additions report only students who were not present yet
+    assert attendance_session.mark_present({"23CSEDS002", "23CSEDS001"}) == ["23CSEDS001", "23CSEDS002"]
+    assert attendance_session.mark_present(["23CSEDS002", "23CSEDS003"]) == ["23CSEDS003"]
+    assert camera.present_students == {"23CSEDS001", "23CSEDS002", "23CSEDS003"}
+    print("✅ Restarted sessions do not inherit the last run's owner, present set or votes")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing attendance sessions...\n")
+    test_get_or_create_and_add()
+    test_latest_for_user_and_present_for_section()
+    test_remove_stops_camera_and_closes_feed()
+    test_one_start_at_a_time()
+    test_restart_begins_from_a_clean_slate()
+    print("\n🎉 All attendance session tests passed!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the section-indexed gallery store built from encodings.pkl
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+
+import numpy as np
+
+from encoding_store import EncodingStore
+from roll_resolver import RollResolver
+
+ENCODINGS_FILE = os.path.join("database", "encodings.pkl")
+
+# Mirrors the SECTIONS configuration in config/settings.py
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 60, "name": "CSE-DS"},
+    "CSEAIML_A": {"prefix": "23CSEAIML", "start": 1, "end": 64, "name": "CSE AIML-A"},
+    "CSEAIML_B": {"prefix": "23CSEAIML", "start": 65, "end": 128, "name": "CSE AIML-B"},
+    "CSEAIML_C": {"prefix": "23CSEAIML", "start": 129, "end": 204, "name": "CSE AIML-C"}
+}
+
+
+def test_section_slices_match_pickle():
+    with open(ENCODINGS_FILE, 'rb') as f:
+        data = pickle.load(f)
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        store = EncodingStore(store_dir, SECTIONS)
+        assert store.is_stale(ENCODINGS_FILE)
+        store.build_from_pickle(ENCODINGS_FILE)
+        assert not store.is_stale(ENCODINGS_FILE)
+
+        resolver = RollResolver(SECTIONS)
+        for section_id in SECTIONS:
+            encodings, names = store.load_section(section_id)
+            expected = [(enc, name) for enc, name in zip(data["encodings"], data["names"])
+                        if resolver.section(name) == section_id]
+
+            assert names == [name for _, name in expected]
+            assert isinstance(encodings, np.memmap)
+            for row, (enc, _) in zip(encodings, expected):
+                assert np.allclose(row, enc, atol=1e-6)
+            print(f"✅ {section_id}: {len(names)} encodings")
+
+
+def test_missing_store_and_section():
+    with tempfile.TemporaryDirectory() as store_dir:
+        store = EncodingStore(os.path.join(store_dir, "gallery"), SECTIONS)
+        encodings, names = store.load_section("CSE_DS")
+        assert names == [] and encodings.shape == (0, 128)
+
+        store.build([np.zeros(128)], ["23CSEDS001"])
+        assert store.load_section("CSEAIML_A")[1] == []
+        assert store.load_section("CSE_DS")[1] == ["23CSEDS001"]
+        print("✅ Missing store and empty section handled")
+
+
+def test_build_after_crash_before_publish():
+    with tempfile.TemporaryDirectory() as store_dir:
+        store = EncodingStore(store_dir, SECTIONS)
+        assert store.build([np.zeros(128)], ["23CSEDS001"]) == 1
+
+        # Crash after the version directory was moved into place but before CURRENT was swapped
+        orphan = os.path.join(store_dir, "v000002")
+        os.makedirs(orphan)
+        with open(os.path.join(orphan, EncodingStore.INDEX_NAME), 'w') as f:
+            f.write("{}")
+        assert store.current_version() == 1
+
+        assert store.build([np.ones(128)], ["23CSEDS002"]) == 3
+        assert store.load_section("CSE_DS")[1] == ["23CSEDS002"]
+        print("✅ A version left unpublished by a crash is skipped")
+
+
+def test_concurrent_builds_publish_distinct_versions():
+    with open(ENCODINGS_FILE, 'rb') as f:
+        data = pickle.load(f)
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        # Separate instances stand in for the gallery watcher and the enrollment CLI
+        stores = [EncodingStore(store_dir, SECTIONS) for _ in range(4)]
+        versions = []
+        threads = [threading.Thread(target=lambda store=store: versions.append(
+            store.build(data["encodings"], data["names"]))) for store in stores]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(versions) == [1, 2, 3, 4]
+        assert stores[0].current_version() == 4
+        assert stores[1].load_section("CSE_DS")[1] == stores[0].load_section("CSE_DS")[1]
+
+        pickle_path = os.path.join(store_dir, "encodings.pkl")
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(data, f)
+        assert stores[2].rebuild_if_stale(pickle_path) == 5
+        assert stores[3].rebuild_if_stale(pickle_path) is None
+        print("✅ Concurrent builds publish one version each")
+
+
+if __name__ == "__main__":
+    test_section_slices_match_pickle()
+    test_missing_store_and_section()
+    test_build_after_crash_before_publish()
+    test_concurrent_builds_publish_distinct_versions()
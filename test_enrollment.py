@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental enrollment and versioned gallery publishing
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from encoding_store import UNASSIGNED_SECTION, EncodingStore
+from enrollment import Enroller, roll_for_photo, file_digest
+
+# Mirrors the SECTIONS configuration in config/settings.py
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 60, "name": "CSE-DS"},
+    "CSEAIML_A": {"prefix": "23CSEAIML", "start": 1, "end": 64, "name": "CSE AIML-A"},
+}
+
+
+def test_photo_names():
+    assert roll_for_photo("23CSEDS001.jpg") == "23CSEDS001"
+    assert roll_for_photo("23cseds001_2.JPG") == "23CSEDS001"
+    assert roll_for_photo("23CSEAIML010_side-view.png") == "23CSEAIML010"
+    assert roll_for_photo("notes.txt") is None
+    assert roll_for_photo("class photo.jpg") is None
+    print("✅ Photos are mapped to roll numbers by file name")
+
+
+def test_unchanged_photos_are_not_reencoded():
+    with tempfile.TemporaryDirectory() as tmp:
+        photos_dir = os.path.join(tmp, "photos")
+        os.makedirs(photos_dir)
+        encodings_file = os.path.join(tmp, "encodings.pkl")
+        cache_file = os.path.join(tmp, "cache.pkl")
+
+        # Existing gallery: one student who has no photo in the folder, one who is re-photographed
+        with open(encodings_file, 'wb') as f:
+            pickle.dump({"encodings": [np.full(128, 0.1), np.full(128, 0.2)],
+                         "names": ["23CSEAIML005", "23CSEDS001"]}, f)
+
+        cache = {}
+        # A stray camera file named like a roll number of no section
+        with open(os.path.join(photos_dir, "IMG1234.jpg"), 'wb') as f:
+            f.write(os.urandom(256))
+        for i, roll in enumerate(["23CSEDS001", "23CSEDS002"]):
+            path = os.path.join(photos_dir, f"{roll}.jpg")
+            with open(path, 'wb') as f:
+                f.write(os.urandom(256))
+            cache[file_digest(path)] = ('ok', np.full(128, i + 1, dtype=np.float32))
+        with open(cache_file, 'wb') as f:
+            pickle.dump(cache, f)
+
+        store = EncodingStore(os.path.join(tmp, "gallery"), SECTIONS)
+        enroller = Enroller(store, photos_dir=photos_dir, encodings_file=encodings_file,
+                            cache_file=cache_file, workers=1)
+        summary = enroller.run()
+
+        assert summary['encoded'] == 0 and summary['reused'] == 2
+        assert summary['unknown_rolls'] == [{'photo': "IMG1234.jpg", 'roll': "IMG1234", 'reason': "unknown roll number"}]
+        assert store.load_section(UNASSIGNED_SECTION)[1] == []
+        assert summary['version'] == 1 and store.current_version() == 1
+        assert not store.is_stale(encodings_file)
+
+        encodings, names = store.load_section("CSE_DS")
+        assert names == ["23CSEDS001", "23CSEDS002"]
+        assert np.allclose(encodings[0], 1)  # Photo replaced the old 0.2 row
+        assert store.load_section("CSEAIML_A")[1] == ["23CSEAIML005"]  # Kept without a photo
+
+        assert enroller.run()['version'] == 2
+        assert store.load_section("CSE_DS")[1] == ["23CSEDS001", "23CSEDS002"]
+        print("✅ Cached photos are reused and each run publishes a new gallery version")
+
+
+def test_cli_does_not_import_the_app():
+    # The CLI only needs the shared settings, not Flask, MySQL or the app's background threads
+    check = "import sys, enrollment; assert 'app' not in sys.modules and 'flask' not in sys.modules"
+    subprocess.run([sys.executable, "-c", check], check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    print("✅ Enrollment CLI imports settings without the app")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing enrollment...\n")
+    test_photo_names()
+    test_unchanged_photos_are_not_reencoded()
+    test_cli_does_not_import_the_app()
+    print("\n🎉 All enrollment tests passed!")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batched gallery matching against per-face brute force
+"""
+
+import os
+import pickle
+
+import numpy as np
+
+from face_matcher import FaceMatcher
+
+ENCODINGS_FILE = os.path.join("database", "encodings.pkl")
+
+
+def load_gallery():
+    with open(ENCODINGS_FILE, 'rb') as f:
+        data = pickle.load(f)
+    return data["encodings"], data["names"]
+
+
+def test_batched_distances_match_brute_force():
+    known_encodings, known_names = load_gallery()
+    matcher = FaceMatcher(known_encodings, known_names)
+
+    rng = np.random.default_rng(0)
+    probes = np.array(known_encodings[:20]) + rng.normal(0, 0.02, (20, 128))
+    best_indices, best_distances = matcher.match(probes)
+
+    for probe, index, distance in zip(probes, best_indices, best_distances):
+        expected = np.linalg.norm(np.array(known_encodings) - probe, axis=1)
+        assert index == np.argmin(expected)
+        assert abs(distance - expected.min()) < 1e-4
+
+    print(f"✅ {len(probes)} probes matched against {len(matcher)} gallery faces")
+
+
+def test_identify_applies_tolerance():
+    known_encodings, known_names = load_gallery()
+    matcher = FaceMatcher(known_encodings, known_names, tolerance=0.41)
+
+    stranger = np.full(128, 0.5)
+    identities = matcher.identify([known_encodings[3], stranger])
+
+    assert identities[0][0] == known_names[3]
+    assert identities[0][1] > 0.99
+    assert identities[1] == ("Unknown", 0)
+    print(f"✅ {known_names[3]} identified, stranger rejected")
+
+
+def test_ivf_index_matches_exact_at_full_probe():
+    known_encodings, known_names = load_gallery()
+    exact = FaceMatcher(known_encodings, known_names)
+    approximate = FaceMatcher(known_encodings, known_names, index_mode='ivf')
+
+    rng = np.random.default_rng(1)
+    probes = np.array(known_encodings[:50]) + rng.normal(0, 0.02, (50, 128))
+    exact_indices, exact_distances = exact.match(probes)
+
+    full_indices, full_distances = approximate.index.search(probes, nprobe=approximate.index.n_lists)
+    assert (full_indices == exact_indices).all()
+    assert np.allclose(full_distances, exact_distances, atol=1e-4)
+
+    ivf_indices, _ = approximate.match(probes)
+    recall = np.mean(ivf_indices == exact_indices)
+    assert recall >= 0.9
+    print(f"✅ IVF recall@1 {recall:.2f} at nprobe={approximate.index.nprobe}")
+
+
+def test_empty_inputs():
+    matcher = FaceMatcher([], [])
+    assert matcher.identify([np.zeros(128)]) == [("Unknown", 0)]
+
+    known_encodings, known_names = load_gallery()
+    best_indices, best_distances = FaceMatcher(known_encodings, known_names).match([])
+    assert len(best_indices) == 0 and len(best_distances) == 0
+    print("✅ Empty gallery and empty frame handled")
+
+
+if __name__ == "__main__":
+    test_batched_distances_match_brute_force()
+    test_identify_applies_tolerance()
+    test_ivf_index_matches_exact_at_full_probe()
+    test_empty_inputs()
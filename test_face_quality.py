@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the face quality scores used to skip hopeless encodings
+"""
+
+import cv2
+import numpy as np
+
+from face_quality import estimate_yaw, face_size, laplacian_sharpness
+
+
+def _textured_frame(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)
+
+
+def test_face_size_uses_shorter_edge():
+    assert face_size((10, 110, 70, 30)) == 60
+    assert face_size((0, 40, 100, 0)) == 40
+    print("✅ Face size is the shorter box edge")
+
+
+def test_blur_lowers_sharpness():
+    frame = _textured_frame()
+    box = (40, 200, 200, 40)
+    blurred = cv2.GaussianBlur(frame, (0, 0), 4)
+
+    sharp_score = laplacian_sharpness(frame, box)
+    assert sharp_score > 10 * laplacian_sharpness(blurred, box)
+    # Resampled to a fixed size, so the same texture scores alike at any box size
+    upscaled = cv2.resize(frame[40:200, 40:200], (320, 320), interpolation=cv2.INTER_NEAREST)
+    assert laplacian_sharpness(upscaled, (0, 320, 320, 0)) > 0.3 * sharp_score
+    # Boxes running off the frame are clipped, empty crops score zero
+    assert laplacian_sharpness(frame, (-20, 30, 30, -20)) > 0
+    assert laplacian_sharpness(frame, (300, 400, 400, 300)) == 0.0
+    print("✅ Laplacian sharpness separates sharp from blurred faces")
+
+
+def test_yaw_from_landmarks():
+    frontal = {'left_eye': [(40, 50), (60, 50)], 'right_eye': [(100, 50), (120, 50)], 'nose_tip': [(80, 90)]}
+    turned = {'left_eye': [(40, 50), (60, 50)], 'right_eye': [(100, 50), (120, 50)], 'nose_tip': [(110, 90)]}
+    tilted = {'left_eye': [(40, 40), (60, 50)], 'right_eye': [(100, 70), (120, 80)], 'nose_tip': [(60, 100)]}
+
+    assert estimate_yaw(frontal) == 0.0
+    assert abs(estimate_yaw(turned) - 0.5) < 1e-9
+    # In-plane rotation alone is not a pose problem
+    assert estimate_yaw(tilted) < 0.05
+    assert estimate_yaw({'left_eye': [(5, 5)], 'right_eye': [(5, 5)], 'nose_tip': [(5, 9)]}) == float('inf')
+    print("✅ Yaw is estimated from 5-point landmarks")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing face quality scores...\n")
+    test_face_size_uses_shorter_edge()
+    test_blur_lowers_sharpness()
+    test_yaw_from_landmarks()
+    print("\n🎉 All face quality tests passed!")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that tracked faces keep their label and skip re-encoding
+"""
+
+from face_tracker import FaceTracker, box_iou
+
+
+def test_box_iou():
+    assert box_iou((0, 10, 10, 0), (0, 10, 10, 0)) == 1.0
+    assert box_iou((0, 10, 10, 0), (20, 30, 30, 20)) == 0.0
+    assert abs(box_iou((0, 10, 10, 0), (0, 15, 10, 5)) - 1 / 3) < 1e-9
+    print("✅ IoU computed correctly")
+
+
+def test_identified_track_is_reused():
+    tracker = FaceTracker(refresh_frames=100)
+
+    first = tracker.update([(100, 200, 200, 100)])
+    assert first[0].needs_encoding
+    first[0].assign_identity("23CSEDS001", 0.8)
+
+    # The student shifts slightly: same track, label reused, no encoding
+    second = tracker.update([(104, 205, 204, 105)])
+    assert second[0] is first[0]
+    assert not second[0].needs_encoding
+    assert second[0].to_dict()['reused']
+    print(f"✅ Track {second[0].track_id} kept label {second[0].name}")
+
+
+def test_new_lost_and_low_confidence_tracks_are_encoded():
+    tracker = FaceTracker(max_missed=2, min_confidence=0.5, refresh_frames=100)
+
+    confident, doubtful = tracker.update([(0, 50, 50, 0), (0, 300, 50, 250)])
+    confident.assign_identity("23CSEDS001", 0.8)
+    doubtful.assign_identity("23CSEDS002", 0.45)
+
+    tracks = tracker.update([(0, 50, 50, 0), (0, 300, 50, 250), (200, 50, 250, 0)])
+    assert [track.needs_encoding for track in tracks] == [False, True, True]
+
+    # Confident face disappears for a frame, then comes back: re-encode once
+    tracker.update([(0, 300, 50, 250)])
+    back = tracker.update([(0, 50, 50, 0)])
+    assert back[0] is confident and back[0].needs_encoding
+    print("✅ New, low-confidence and re-acquired tracks scheduled for encoding")
+
+
+def test_unsettled_tracks_are_encoded_every_frame():
+    present = set()
+    tracker = FaceTracker(refresh_frames=100, settled=present.__contains__)
+    track = tracker.update([(0, 50, 50, 0)])[0]
+    track.assign_identity("23CSEDS001", 0.8)
+    assert tracker.update([(0, 50, 50, 0)])[0].needs_encoding
+
+    present.add("23CSEDS001")
+    assert not tracker.update([(0, 50, 50, 0)])[0].needs_encoding
+    print("✅ Tracks are re-encoded until their student is settled")
+
+
+def test_stale_tracks_expire():
+    tracker = FaceTracker(max_missed=1)
+    tracker.update([(0, 50, 50, 0)])
+    tracker.update([])
+    assert len(tracker.tracks) == 1
+    tracker.update([])
+    assert tracker.tracks == []
+    print("✅ Lost tracks dropped after max_missed frames")
+
+
+if __name__ == "__main__":
+    test_box_iou()
+    test_identified_track_is_reused()
+    test_unsettled_tracks_are_encoded_every_frame()
+    test_new_lost_and_low_confidence_tracks_are_encoded()
+    test_stale_tracks_expire()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that the recognition rate follows scene activity
+"""
+
+import numpy as np
+
+from frame_scheduler import MotionScheduler
+
+
+def run_scheduler(scheduler, frames, fps=20):
+    """Feed frames at a fixed capture rate, return the number dispatched"""
+    dispatched = 0
+    for i, frame in enumerate(frames):
+        now = i / fps
+        if scheduler.should_recognize(frame, now=now):
+            scheduler.mark_dispatched(now=now)
+            dispatched += 1
+    return dispatched
+
+
+def test_static_scene_trickles():
+    scheduler = MotionScheduler(min_rate=0.5, max_rate=10.0)
+    still = np.full((480, 640, 3), 90, dtype=np.uint8)
+    run_scheduler(scheduler, [still] * 40)
+
+    # Ten seconds of an unchanging lecture hall
+    dispatched = run_scheduler(scheduler, [still] * 200)
+    assert scheduler.motion_score < 0.01
+    assert dispatched <= 8
+    print(f"✅ Static scene: {dispatched} recognition frames in 10 s")
+
+
+def test_activity_bursts():
+    scheduler = MotionScheduler(min_rate=0.5, max_rate=10.0)
+    # A bright block sweeping across the room, like students walking in
+    busy = []
+    for i in range(200):
+        frame = np.full((480, 640, 3), 90, dtype=np.uint8)
+        left = (i * 40) % 480
+        frame[100:400, left:left + 160] = 230
+        busy.append(frame)
+
+    dispatched = run_scheduler(scheduler, busy)
+    assert scheduler.motion_score > 0.9
+    assert dispatched >= 60
+    print(f"✅ Busy scene: {dispatched} recognition frames in 10 s")
+
+
+def test_effective_rate_window():
+    scheduler = MotionScheduler()
+    for i in range(10):
+        scheduler.mark_dispatched(now=100 + i * 0.5)
+    assert scheduler.effective_rate(window=5.0, now=104.5) == 2.0
+    assert scheduler.effective_rate(window=5.0, now=200) == 0.0
+    print("✅ Effective recognition rate measured over the window")
+
+
+if __name__ == "__main__":
+    test_static_scene_trickles()
+    test_activity_bursts()
+    test_effective_rate_window()
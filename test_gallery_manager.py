@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for hot reloading the face gallery into running sessions
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from encoding_store import EncodingStore
+from gallery_manager import GalleryManager
+
+# Mirrors the SECTIONS configuration in config/settings.py
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 60, "name": "CSE-DS"},
+}
+
+
+class _RunningSession:
+    def __init__(self):
+        self.matcher = None
+        self.version = None
+
+    def swap_matcher(self, matcher, version):
+        self.matcher = matcher
+        self.version = version
+
+
+def test_new_version_swapped_into_running_session():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EncodingStore(os.path.join(tmp, "gallery"), SECTIONS)
+        store.build([np.full(128, 0.1)], ["23CSEDS001"])
+        manager = GalleryManager(store, os.path.join(tmp, "missing.pkl"))
+
+        matcher = manager.matcher_for("CSE_DS")
+        assert len(matcher) == 1 and manager.version == 1
+        assert manager.matcher_for("CSE_DS") is matcher  # Cached per version
+
+        session = _RunningSession()
+        manager.register("CSE_DS", session)
+        assert not manager.check_for_updates()
+
+        # Enrollment publishes a second student mid-semester
+        store.build([np.full(128, 0.1), np.full(128, 0.3)], ["23CSEDS001", "23CSEDS002"])
+        assert manager.check_for_updates()
+
+        assert session.version == 2 and len(session.matcher) == 2
+        assert manager.matcher_for("CSE_DS") is session.matcher
+        assert session.matcher.identify(np.full((1, 128), 0.3))[0][0] == "23CSEDS002"
+
+        status = manager.status()
+        assert status['version'] == 2 and status['size'] == 2
+        assert status['sections'] == {"CSE_DS": 2} and status['running_sessions'] == 1
+        print("✅ New gallery version swapped into the running session")
+
+
+def test_finished_sessions_are_dropped():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EncodingStore(os.path.join(tmp, "gallery"), SECTIONS)
+        store.build([np.full(128, 0.1)], ["23CSEDS001"])
+        manager = GalleryManager(store, os.path.join(tmp, "missing.pkl"))
+
+        manager.register("CSE_DS", _RunningSession())  # Nothing else references it
+        assert manager.status()['running_sessions'] == 0
+        print("✅ Sessions that went away are not kept alive by the manager")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing gallery manager...\n")
+    test_new_version_swapped_into_running_session()
+    test_finished_sessions_are_dropped()
+    print("\n🎉 All gallery manager tests passed!")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for tiling and duplicate merging in group photo attendance
+"""
+
+import numpy as np
+
+from group_photo import tile_boxes, merge_detections
+
+
+def test_tiles_cover_image_with_overlap():
+    height, width = 3000, 4000  # 12 MP phone photo
+    tiles = tile_boxes(height, width, tile_size=1280, overlap=320)
+
+    covered = np.zeros((height, width), dtype=bool)
+    for top, left, bottom, right in tiles:
+        assert bottom - top <= 1280 and right - left <= 1280
+        covered[top:bottom, left:right] = True
+    assert covered.all()
+
+    # Neighbouring tiles share at least the requested overlap
+    lefts = sorted({tile[1] for tile in tiles})
+    assert all(b - a <= 1280 - 320 for a, b in zip(lefts, lefts[1:]))
+    print(f"✅ {len(tiles)} tiles cover a 4000x3000 photo")
+
+
+def test_small_image_single_tile():
+    assert tile_boxes(480, 640) == [(0, 0, 480, 640)]
+    print("✅ Small images are a single tile")
+
+
+def test_merge_border_duplicates():
+    whole = (100, 300, 300, 100)       # Face found whole in one tile
+    partial = (100, 300, 300, 220)     # Same face cut by the neighbouring tile's border
+    shifted = (104, 302, 298, 104)     # Same face found again by the overview pass
+    other = (100, 700, 300, 500)       # A different student
+
+    merged = merge_detections([partial, whole, shifted, other])
+    assert sorted(merged) == sorted([whole, other]), merged
+    print("✅ Duplicate and partial border detections are merged")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing group photo tiling...\n")
+    test_tiles_cover_image_with_overlap()
+    test_small_image_single_tile()
+    test_merge_border_duplicates()
+    print("\n🎉 All group photo tests passed!")
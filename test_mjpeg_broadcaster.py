@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared-encode MJPEG broadcaster
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from mjpeg_broadcaster import MJPEGBroadcaster, placeholder_chunk
+
+
+class _FakeCamera:
+    """Counts renders; the version moves only when a new frame is 'captured'"""
+
+    def __init__(self):
+        self.version = 0
+        self.renders = 0
+
+    def render(self):
+        self.renders += 1
+        return np.full((120, 160, 3), self.version % 255, dtype=np.uint8)
+
+    def capture(self):
+        self.version += 1
+
+
+def _consume(broadcaster, count, received, delay=0.0):
+    frames = broadcaster.subscribe(timeout=0.2)
+    for chunk in frames:
+        received.append(chunk)
+        if len(received) >= count:
+            break
+        time.sleep(delay)
+    frames.close()
+
+
+def test_one_encode_shared_by_all_viewers():
+    camera = _FakeCamera()
+    broadcaster = MJPEGBroadcaster(camera.render, lambda: camera.version, max_fps=100)
+
+    # All three viewers stay subscribed for the whole test
+    streams = [broadcaster.subscribe(timeout=0.2) for _ in range(3)]
+    viewers = [[next(stream)] for stream in streams]
+    time.sleep(0.1)  # Unchanged frame: nothing more is encoded
+    for stream in streams:
+        stream.close()
+    broadcaster.close()
+
+    assert all(len(received) == 1 for received in viewers)
+    assert viewers[0][0] is viewers[1][0] is viewers[2][0]
+    assert camera.renders == 1, camera.renders
+    assert viewers[0][0].startswith(b'--frame\r\nContent-Type: image/jpeg')
+    print("✅ Three viewers share a single encode of an unchanged frame")
+
+
+def test_slow_viewer_does_not_block():
+    camera = _FakeCamera()
+    broadcaster = MJPEGBroadcaster(camera.render, lambda: camera.version, max_fps=200)
+    running = True
+
+    def capture_loop():
+        while running:
+            camera.capture()
+            time.sleep(0.005)
+
+    fast, slow = [], []
+    capturer = threading.Thread(target=capture_loop)
+    capturer.start()
+    fast_viewer = threading.Thread(target=_consume, args=(broadcaster, 40, fast))
+    slow_viewer = threading.Thread(target=_consume, args=(broadcaster, 4, slow, 0.2))
+    slow_viewer.start()
+    fast_viewer.start()
+    fast_viewer.join(timeout=5)
+    fast_done = not fast_viewer.is_alive()
+    slow_viewer.join(timeout=5)
+    running = False
+    capturer.join()
+    broadcaster.close()
+
+    assert fast_done and len(fast) == 40
+    assert len(slow) == 4
+    print("✅ A slow viewer skips frames without holding up the others")
+
+
+def test_placeholder_cached():
+    assert placeholder_chunk("Camera not active") is placeholder_chunk("Camera not active")
+    print("✅ Placeholder frames are encoded once")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing MJPEG broadcaster...\n")
+    test_one_encode_shared_by_all_viewers()
+    test_slow_viewer_does_not_block()
+    test_placeholder_cached()
+    print("\n🎉 All MJPEG broadcaster tests passed!")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the rolling per-stage pipeline metrics
+"""
+
+import threading
+
+from pipeline_metrics import PipelineMetrics, RollingHistogram, stage_timer
+
+
+def test_histogram_percentiles_and_buckets():
+    histogram = RollingHistogram(window=100)
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 100 and snapshot['window'] == 100
+    assert 49 <= snapshot['p50_ms'] <= 51
+    assert 98 <= snapshot['p99_ms'] <= 100
+    assert sum(snapshot['buckets'].values()) == 100
+    assert snapshot['buckets']['<=1ms'] == 1 and snapshot['buckets']['<=100ms'] == 50
+    print("✅ Percentiles and buckets computed over the window")
+
+
+def test_window_rolls_over():
+    histogram = RollingHistogram(window=10)
+    for _ in range(50):
+        histogram.record(0.5)
+    for _ in range(10):
+        histogram.record(0.001)
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 60 and snapshot['window'] == 10
+    assert snapshot['max_ms'] < 2
+    print("✅ Old samples fall out of the rolling window")
+
+
+def test_metrics_threads_and_counters():
+    metrics = PipelineMetrics()
+
+    def worker():
+        for _ in range(500):
+            with metrics.time('detect'):
+                pass
+            metrics.increment('queue_drops')
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with stage_timer(None, 'detect'):
+        pass  # No metrics: nothing recorded, nothing raised
+
+    snapshot = metrics.snapshot()
+    assert snapshot['counters']['queue_drops'] == 2000
+    assert snapshot['stages']['detect']['count'] == 2000
+    print("✅ Counters and timers are safe across threads")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing pipeline metrics...\n")
+    test_histogram_percentiles_and_buckets()
+    test_window_rolls_over()
+    test_metrics_threads_and_counters()
+    print("\n🎉 All pipeline metrics tests passed!")
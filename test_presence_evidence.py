@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test script for k-of-n presence votes
+"""
+
+import json
+
+from face_tracker import FaceTracker
+from presence_evidence import PresenceEvidence
+
+ROLLS = ["23CSEDS001", "23CSEDS002", "23CSEDS003"]
+
+
+def _face(name, confidence):
+    return {'name': name, 'confidence': confidence}
+
+
+def test_present_only_after_k_of_n_matches():
+    evidence = PresenceEvidence(ROLLS, k=3, n=5)
+
+    # A single lucky frame no longer marks anyone present
+    assert evidence.update([_face("23CSEDS001", 0.7)], 1.0) == []
+    assert evidence.update([], 2.0) == []
+    assert evidence.update([_face("23CSEDS001", 0.6), _face("Unknown", 0)], 3.0) == []
+    assert not evidence.is_present("23CSEDS001")
+    assert evidence.update([_face("23CSEDS001", 0.8), _face("23CSEDS001", 0.5)], 4.0) == ["23CSEDS001"]
+    assert evidence.is_present("23CSEDS001")
+    assert evidence.update([_face("23CSEDS001", 0.8)], 5.0) == []  # Reported once
+
+    record = evidence.to_dict()
+    assert list(record) == ["23CSEDS001"]
+    assert record["23CSEDS001"]['hits'] == 4
+    assert abs(record["23CSEDS001"]['best_distance'] - 0.2) < 1e-4
+    assert record["23CSEDS001"]['first_seen'] == 1.0 and record["23CSEDS001"]['last_seen'] == 5.0
+    assert record["23CSEDS001"]['marked_at'] == 4.0
+    json.dumps(record)  # Goes straight into the status API and the saved record
+    print("✅ Students are marked present after k of n matching frames")
+
+
+def test_sparse_and_weak_matches_do_not_count():
+    evidence = PresenceEvidence(ROLLS, k=2, n=3, min_confidence=0.4)
+
+    # Matches further apart than the window never add up
+    for t in range(12):
+        faces = [_face("23CSEDS002", 0.9)] if t % 3 == 0 else []
+        assert evidence.update(faces, float(t)) == []
+    # Weak matches are kept out of the vote entirely
+    evidence.update([_face("23CSEDS003", 0.3)], 12.0)
+    evidence.update([_face("23CSEDS003", 0.35)], 13.0)
+    assert "23CSEDS003" not in evidence.to_dict()
+    assert evidence.to_dict()["23CSEDS002"]['hits'] == 4
+    print("✅ Sparse and low-confidence matches never reach the vote threshold")
+
+
+def _tracked_frame(tracker, location, name, confidence):
+    """One recognition frame of a seated student through the tracker, as recognize_frame builds it"""
+    track = tracker.update([location])[0]
+    if track.needs_encoding:
+        track.assign_identity(name, confidence)
+    return [{'name': track.name, 'confidence': track.confidence, **track.to_dict()}]
+
+
+def test_tracked_student_is_voted_present():
+    evidence = PresenceEvidence(ROLLS, k=3, n=5)
+    # The app's defaults: identified tracks are otherwise only re-encoded every 30 frames
+    tracker = FaceTracker(refresh_frames=30, settled=evidence.is_present)
+    location = (100, 200, 200, 100)
+
+    marked = [evidence.update(_tracked_frame(tracker, location, "23CSEDS001", 0.8), float(t)) for t in range(6)]
+    assert marked[:3] == [[], [], ["23CSEDS001"]] and not any(marked[3:])
+
+    # Once present the label is reused, and reused labels cast no further votes
+    faces = _tracked_frame(tracker, location, "23CSEDS001", 0.8)
+    assert faces[0]['reused']
+    evidence.update(faces, 6.0)
+    assert evidence.to_dict()["23CSEDS001"]['hits'] == 3
+
+    # Without the settled hook a still face would be re-encoded only once per refresh
+    unsettled = PresenceEvidence(ROLLS, k=3, n=5)
+    tracker = FaceTracker(refresh_frames=30)
+    for t in range(200):
+        unsettled.update(_tracked_frame(tracker, location, "23CSEDS002", 0.8), float(t))
+    assert not unsettled.is_present("23CSEDS002")
+    print("✅ Tracked students are re-encoded until voted present, then reused without voting")
+
+
+def test_rebind_keeps_evidence_by_roll():
+    evidence = PresenceEvidence(["23CSEDS002", "23CSEDS003"], k=2, n=3)
+    evidence.update([_face("23CSEDS003", 0.7)], 1.0)
+
+    # A new gallery version adds a student that sorts before the others
+    evidence.rebind(ROLLS)
+    assert len(evidence) == 3
+    assert evidence.update([_face("23CSEDS003", 0.7), _face("23CSEDS001", 0.9)], 2.0) == ["23CSEDS003"]
+    assert evidence.to_dict()["23CSEDS001"]['hits'] == 1
+
+    evidence.reset()
+    assert evidence.to_dict() == {} and not evidence.is_present("23CSEDS003")
+    print("✅ Evidence follows students across gallery versions")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing presence evidence...\n")
+    test_present_only_after_k_of_n_matches()
+    test_sparse_and_weak_matches_do_not_count()
+    test_tracked_student_is_voted_present()
+    test_rebind_keeps_evidence_by_roll()
+    print("\n🎉 All presence evidence tests passed!")
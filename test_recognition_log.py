@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for the recognition log writer and offline replay
+"""
+
+import os
+import tempfile
+import time
+
+from recognition_log import RecognitionLogWriter, read_log, replay
+
+
+def _face(nearest, distance, track_id=None, tolerance=0.41):
+    face = {'name': nearest if distance < tolerance else "Unknown",
+            'confidence': 1 - distance if distance < tolerance else 0,
+            'location': (10, 60, 60, 10), 'nearest': nearest, 'distance': distance}
+    if track_id is not None:
+        face['track_id'] = track_id
+    return face
+
+
+def _write_session(path):
+    log = RecognitionLogWriter(path, header={'session_id': "CSE_DS", 'tolerance': 0.41, 'presence_votes': 2})
+    # 23CSEDS001 matches cleanly; 23CSEDS002 sits just beyond the live tolerance
+    for t in range(4):
+        log.write_frame(float(t), [_face("23CSEDS001", 0.30), _face("23CSEDS002", 0.44)])
+    log.write({'type': 'present', 't': 1.0, 'students': ["23CSEDS001"]})
+    log.close()
+    return log
+
+
+def test_writer_appends_json_lines():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "logs", "CSE_DS.jsonl")
+        log = _write_session(path)
+
+        records = list(read_log(path))
+        assert [record['type'] for record in records] == ['session'] + ['frame'] * 4 + ['present', 'end']
+        assert records[0]['session_id'] == "CSE_DS"
+        assert records[1]['faces'][1] == {'name': "Unknown", 'confidence': 0, 'nearest': "23CSEDS002",
+                                          'distance': 0.44}
+        assert log.written == 6 and log.dropped == 0
+
+        # A crash mid-write leaves a torn last line, which ends the log
+        with open(path, 'a') as f:
+            f.write('{"type": "fra')
+        assert len(list(read_log(path))) == 7
+        print("✅ Recognition frames are appended as JSON lines")
+
+
+def test_bad_records_are_dropped_and_close_never_hangs():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "CSE_DS.jsonl")
+        log = RecognitionLogWriter(path)
+        log.write({'type': 'present', 't': 1.0, 'students': {"23CSEDS001"}})  # A set is not JSON
+        log.write_frame(2.0, [{'name': "23CSEDS001"}])  # No confidence to compact
+        log.write_frame(3.0, [_face("23CSEDS001", 0.30)])
+        log.close()
+        records = list(read_log(path))
+        assert [record['type'] for record in records] == ['frame', 'end']
+        assert log.written == 1 and records[-1]['dropped'] == 2
+
+        # A writer that cannot open its file stops and leaves a full queue behind
+        log = RecognitionLogWriter(tmp, max_pending=2)
+        log._thread.join()
+        for t in range(3):
+            log.write_frame(float(t), [])
+        started = time.monotonic()
+        log.close(timeout=0.2)
+        assert time.monotonic() - started < 1.0
+        print("✅ Bad records are dropped and close returns even when the writer is gone")
+
+
+def test_replay_under_other_thresholds():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "CSE_DS.jsonl")
+        _write_session(path)
+        records = list(read_log(path))
+
+        present, _ = replay(records, tolerance=0.41, votes=2, window=5)
+        assert present == {"23CSEDS001"}
+        present, evidence = replay(records, tolerance=0.45, votes=2, window=5)
+        assert present == {"23CSEDS001", "23CSEDS002"}
+        assert evidence.to_dict()["23CSEDS002"]['hits'] == 4
+        present, _ = replay(records, tolerance=0.25, votes=2, window=5)
+        assert present == set()
+        print("✅ Attendance is recomputed under other tolerances")
+
+
+def test_replay_counts_only_encoded_faces():
+    records = [
+        {'type': 'frame', 't': 0.0, 'faces': [{'name': "Unknown", 'confidence': 0, 'track': 1,
+                                                'nearest': "23CSEDS003", 'distance': 0.43}]},
+        {'type': 'frame', 't': 1.0, 'faces': [{'name': "Unknown", 'confidence': 0, 'track': 1}]},
+        {'type': 'gallery', 't': 1.5, 'version': 2},
+        {'type': 'frame', 't': 2.0, 'faces': [{'name': "Unknown", 'confidence': 0, 'track': 1}]},
+        {'type': 'frame', 't': 3.0, 'faces': [{'name': "Unknown", 'confidence': 0, 'skipped': "blurred"}]},
+    ]
+    present, evidence = replay(records, tolerance=0.45, votes=1, window=5)
+    assert present == {"23CSEDS003"}
+    assert evidence.to_dict()["23CSEDS003"]['hits'] == 1
+    print("✅ Faces reused from a track do not vote in the replay")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing recognition log...\n")
+    test_writer_appends_json_lines()
+    test_bad_records_are_dropped_and_close_never_hangs()
+    test_replay_under_other_thresholds()
+    test_replay_counts_only_encoded_faces()
+    print("\n🎉 All recognition log tests passed!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the roll number to section resolver
+"""
+
+import os
+import pickle
+
+from roll_resolver import RollResolver
+
+ENCODINGS_FILE = os.path.join("database", "encodings.pkl")
+
+# Mirrors the SECTIONS configuration in config/settings.py
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 60, "name": "CSE-DS"},
+    "CSEAIML_A": {"prefix": "23CSEAIML", "start": 1, "end": 64, "name": "CSE AIML-A"},
+    "CSEAIML_B": {"prefix": "23CSEAIML", "start": 65, "end": 128, "name": "CSE AIML-B"},
+    "CSEAIML_C": {"prefix": "23CSEAIML", "start": 129, "end": 204, "name": "CSE AIML-C"}
+}
+
+
+def test_resolves_section_code_and_row():
+    resolver = RollResolver(SECTIONS)
+    info = resolver.resolve("23CSEAIML065")
+    assert (info.section, info.code, info.row, info.number) == ("CSEAIML_B", 2, 0, 65)
+    assert resolver.resolve("23CSEAIML204").row == 75
+    assert resolver.section("23CSEDS060") == "CSE_DS"
+    # Sections sharing a prefix are told apart by range, not by the first prefix match
+    assert resolver.section("23CSEAIML150") == "CSEAIML_C"
+    for roll in ("23CSEDS061", "23CSEAIML000", "23CSEDS", "23CSEDS01A", "22CSE998", "", "Unknown", None):
+        assert resolver.resolve(roll) is None, roll
+    assert resolver.rolls("CSEAIML_B")[:2] == ["23CSEAIML065", "23CSEAIML066"]
+    assert len(resolver.rolls("CSEAIML_C")) == 76
+    print("✅ Rolls resolve to section, code and row")
+
+
+def test_nested_prefixes_fall_back_to_shorter_ones():
+    resolver = RollResolver({
+        "LOW": {"prefix": "CS1", "start": 1, "end": 50},
+        "HIGH": {"prefix": "CS", "start": 100, "end": 199},
+    })
+    rolls = ["CS150", "CS199", "CS1050", "CS17", "CS099"]
+    expected = ["LOW", "HIGH", "LOW", "LOW", None]
+    assert [resolver.section(roll) for roll in rolls] == expected
+    assert resolver.sections_of(rolls) == expected
+    print("✅ The longest matching prefix wins, shorter ones are tried next")
+
+
+def test_vectorized_matches_single_lookups():
+    with open(ENCODINGS_FILE, 'rb') as f:
+        names = list(pickle.load(f)["names"])
+    names += ["23CSEDS061", "23CSEAIML9999999999", "23CSEDS1", "x", ""]
+
+    resolver = RollResolver(SECTIONS)
+    codes, rows = resolver.resolve_many(names)
+    for name, code, row in zip(names, codes, rows):
+        info = resolver.resolve(name)
+        assert (code, row) == ((info.code, info.row) if info else (-1, -1)), name
+    assert resolver.resolve_many([])[0].shape == (0,)
+    print(f"✅ resolve_many agrees with resolve on {len(names)} rolls")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing roll resolver...\n")
+    test_resolves_section_code_and_row()
+    test_nested_prefixes_fall_back_to_shorter_ones()
+    test_vectorized_matches_single_lookups()
+    print("\n🎉 All roll resolver tests passed!")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the resumable per-session event feed
+"""
+
+import json
+import threading
+
+from session_events import SessionEventLog
+
+
+def test_resume_returns_missed_deltas():
+    events = SessionEventLog()
+    events.publish('present', {'students': ["23CSEDS001"]})
+    events.publish('stats', {'fps': 10.0})
+    events.publish('faces', {'faces': []})
+    events.publish('stats', {'fps': 12.0})
+    events.publish('present', {'students': ["23CSEDS002"]})
+
+    missed, complete = events.since(1)
+    assert complete
+    # Every presence delta, but only the newest of each replaceable state
+    assert [event.seq for event in missed] == [3, 4, 5]
+    assert json.loads(missed[1].data) == {'fps': 12.0}
+    assert events.since(5) == ([], True)
+
+    wire = missed[-1].to_sse()
+    assert wire.startswith("id: 5\nevent: present\ndata: ") and wire.endswith("\n\n")
+    print("✅ Resuming clients get the deltas they missed")
+
+
+def test_evicted_or_foreign_seq_is_incomplete():
+    events = SessionEventLog(capacity=3)
+    for i in range(6):
+        events.publish('present', {'students': [f"23CSEDS00{i}"]})
+
+    assert events.since(3)[1]
+    assert not events.since(1)[1]  # Events 2 and 3 were evicted
+    assert not events.since(40)[1]  # Sequence number from before a server restart
+    print("✅ Clients too far behind are told to resynchronize")
+
+
+def test_wait_wakes_on_publish_and_close():
+    events = SessionEventLog()
+    assert not events.wait(0, timeout=0.01)
+
+    publisher = threading.Timer(0.05, events.publish, args=('stats', {'fps': 1.0}))
+    publisher.start()
+    assert events.wait(0, timeout=2.0)
+
+    closer = threading.Timer(0.05, events.close)
+    closer.start()
+    assert not events.wait(events.last_seq, timeout=2.0)
+    assert events.closed
+    print("✅ Waiting clients wake up on new events and on close")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing session events...\n")
+    test_resume_returns_missed_deltas()
+    test_evicted_or_foreign_seq_is_incomplete()
+    test_wait_wakes_on_publish_and_close()
+    print("\n🎉 All session event tests passed!")
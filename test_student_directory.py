@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for the indexed student directory
+"""
+
+import json
+import os
+import tempfile
+
+from student_directory import StudentDirectory, calculate_cgpa, latest_sgpa
+from versioned_cache import file_version
+
+SECTIONS = {
+    "CSE_DS": {"prefix": "23CSEDS", "start": 1, "end": 3},
+    "CSEAIML_A": {"prefix": "23CSEAIML", "start": 1, "end": 2},
+}
+
+STUDENTS = [
+    {"id": 1, "rollNo": "23CSEDS001", "name": "ASHA", "mobile": "9000000001",
+     "sgpas": {"1": "8.0", "2": "9.0", "3": "-"}},
+    {"id": 2, "rollNo": "23CSEDS003", "name": "RAVI", "mobile": "9000000003", "sgpas": {"10": "7.0", "2": "6.5"}},
+    {"id": 3, "rollNo": "23CSEAIML002", "name": "MEERA", "mobile": "9000000004", "sgpas": {}},
+]
+
+
+def _directory(tmp, students):
+    path = os.path.join(tmp, "details.json")
+    with open(path, 'w') as f:
+        json.dump(students, f)
+
+    def load():
+        with open(path) as f:
+            return json.load(f)
+    return path, StudentDirectory(load, lambda: file_version(path), SECTIONS, check_interval=0)
+
+
+def test_grades_are_precomputed():
+    assert calculate_cgpa({"1": "8.0", "2": "9.0", "3": "-"}) == 8.5
+    assert calculate_cgpa({}) == 0.0
+    # Semesters sort numerically, not as strings
+    assert latest_sgpa({"10": "7.0", "2": "6.5"}) == "7.0"
+    assert latest_sgpa({}) == 'N/A'
+    print("✅ CGPA and latest SGPA follow the app's rules")
+
+
+def test_lookups_by_roll_and_section():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, directory = _directory(tmp, STUDENTS)
+
+        assert directory.get("23CSEDS001")["name"] == "ASHA"
+        assert directory.get("23CSEDS002") is None
+        assert directory.info("23CSEDS002")["name"] == "Student 23CSEDS002"
+        assert directory.cgpa("23CSEDS001") == 8.5
+        assert directory.latest_sgpa("23CSEDS003") == "7.0"
+        assert "23CSEAIML002" in directory and len(directory) == 3
+
+        rolls = [student["rollNo"] for student in directory.section_students("CSE_DS")]
+        assert rolls == ["23CSEDS001", "23CSEDS002", "23CSEDS003"]
+        assert directory.section_students("CSE_DS")[0] is directory.get("23CSEDS001")
+        assert directory.section_students("CSEAIML_A")[1]["name"] == "MEERA"
+        assert directory.loads == 1  # Every lookup above shared one parse
+        print("✅ Students are found by roll number and by section")
+
+
+def test_file_changes_rebuild_the_index():
+    with tempfile.TemporaryDirectory() as tmp:
+        path, directory = _directory(tmp, STUDENTS)
+        assert directory.get("23CSEDS002") is None
+
+        with open(path, 'w') as f:
+            json.dump(STUDENTS + [{"id": 4, "rollNo": "23CSEDS002", "name": "KIRAN", "mobile": "9000000002",
+                                   "sgpas": {"1": "9.5"}}], f)
+        assert directory.get("23CSEDS002")["name"] == "KIRAN"
+        assert directory.cgpa("23CSEDS002") == 9.5
+        assert directory.loads == 2
+        print("✅ Editing details.json rebuilds the directory")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing student directory...\n")
+    test_grades_are_precomputed()
+    test_lookups_by_roll_and_section()
+    test_file_changes_rebuild_the_index()
+    print("\n🎉 All student directory tests passed!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the version-keyed in-process cache
+"""
+
+import json
+import os
+import tempfile
+
+from versioned_cache import VersionedCache, file_version
+
+
+def test_reloads_only_when_version_changes():
+    state = {'version': 1, 'loads': 0}
+
+    def load():
+        state['loads'] += 1
+        return {'loaded': state['loads']}
+
+    cache = VersionedCache(load, lambda: state['version'], check_interval=0)
+    first = cache.get()
+    assert cache.get() is first and cache.get() is first
+    assert state['loads'] == 1
+
+    state['version'] = 2
+    assert cache.get() == {'loaded': 2}
+    cache.invalidate()
+    assert cache.get() == {'loaded': 3} and cache.loads == 3
+    print("✅ Value is reloaded only when its version changes or it is invalidated")
+
+
+def test_version_checked_once_per_interval():
+    checks = []
+    cache = VersionedCache(lambda: "value", lambda: checks.append(1) or 1, check_interval=60.0)
+    for _ in range(100):
+        cache.get()
+    assert len(checks) == 1
+    print("✅ Repeated reads within the check interval stay in memory")
+
+
+def test_file_version_tracks_rewrites():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "details.json")
+        assert file_version(path) is None
+        with open(path, 'w') as f:
+            json.dump([1], f)
+        before = file_version(path)
+        with open(path, 'w') as f:
+            json.dump([1, 2, 3], f)
+        assert file_version(path) != before
+        print("✅ File versions change when a file is rewritten")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing versioned cache...\n")
+    test_reloads_only_when_version_changes()
+    test_version_checked_once_per_interval()
+    test_file_version_tracks_rewrites()
+    print("\n🎉 All versioned cache tests passed!")
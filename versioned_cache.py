@@ -0,0 +1,56 @@
+"""
+Versioned Cache - Shared in-process cache of one loaded value
+The value is reloaded only when its version key changes (a file's mtime and
+size, a database change counter, ...). The key is looked up at most once per
+check interval, so repeated reads within and across requests stay in memory.
+Every caller gets the same object, which must be treated as read-only.
+"""
+
+import os
+import threading
+import time
+
+_MISSING = object()
+
+
+def file_version(path):
+    """(mtime_ns, size) of a file, or None when it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class VersionedCache:
+    """Thread-safe lazily loaded value, invalidated by a version key"""
+
+    def __init__(self, load, version, check_interval=1.0):
+        self.load = load  # () -> value
+        self.version = version  # () -> hashable key that changes whenever the value would
+        self.check_interval = check_interval
+        self.loads = 0
+        self._value = _MISSING
+        self._key = _MISSING
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._value is not _MISSING and now - self._checked_at < self.check_interval:
+                return self._value
+
+            key = self.version()
+            self._checked_at = now
+            if self._value is _MISSING or key != self._key:
+                # Key first: a change made while loading is picked up by the next check
+                self._key = key
+                self._value = self.load()
+                self.loads += 1
+            return self._value
+
+    def invalidate(self):
+        """Drop the value after a write through this process"""
+        with self._lock:
+            self._value = _MISSING